@@ -17,12 +17,38 @@ VISION_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 # 'en-GB-RyanNeural' is a crisp, professional British male voice.
 # 'en-GB-SoniaNeural' is a British female option if you prefer.
 VOICE_NAME = "en-GB-RyanNeural"  
+# "tiny.en" is the lightest option. "distil-small.en" (Distil-Whisper) is
+# noticeably more accurate at a moderate latency cost; pair it with
+# WHISPER_COMPUTE_TYPE = "int8_float32" on CPUs with AVX-512 VNNI.
+# A CTranslate2 model directory path also works here.
 WHISPER_SIZE = "tiny.en"
+# CTranslate2 compute type: "auto" picks the fastest kernel for this CPU.
+# Set e.g. "int8" or "int8_float32" to force one.
+WHISPER_COMPUTE_TYPE = "auto"
 
 # --- MEMORY ---
 MAX_MEMORY_DEPTH = 10
+# Seconds to wait after a change before writing memory to disk;
+# saves made in the meantime are folded into a single write
+MEMORY_SAVE_DELAY = 2.0
 
 # --- PERFORMANCE / RESOURCE CONTROL ---
+# Cloud replies are reused for an identical prompt + recent conversation
+RESPONSE_CACHE_SIZE = 128  # entries
+RESPONSE_CACHE_TTL = 300   # seconds
+CACHE_CONTEXT = 2          # earlier messages a cached reply must share
+# Reworded repeats of a question (needs the embedding model, see ENABLE_VECTOR_MEMORY)
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_CACHE_TTL = 3600       # seconds
+SEMANTIC_CACHE_THRESHOLD = 0.92 # cosine similarity
+
+# Tool results longer than this (characters) are shown on the overlay
+# and only a short confirmation is spoken
+SPOKEN_RESULT_LIMIT = 200
+
+# Print per-command debug traces to the console
+DEBUG = False
+
 # Set to False to save ~1GB+ RAM by disabling semantic search features
 ENABLE_VECTOR_MEMORY = False
 
@@ -35,13 +61,15 @@ WAVEFORM_ANIMATION_INTERVAL = 100  # ms (default was 50)
 DIAGNOSTICS_UPDATE_INTERVAL = 5000 # ms (default was 2000)
 
 # --- VISION KEYWORDS ---
-VISION_KEYWORDS = ["look", "see", "screen", "what is this", "describe", "read"]
+# Keyword collections are tuples: fixed at load time, and usable directly
+# with str.startswith()/endswith() as a single C-level check
+VISION_KEYWORDS = ("look", "see", "screen", "what is this", "describe", "read")
 
 # --- SYSTEM KEYWORDS ---
-SYSTEM_KEYWORDS = ["open", "start", "launch", "check", "cpu", "ram", "memory", "system", "pc", "search", "google", "volume", 
+SYSTEM_KEYWORDS = ("open", "start", "launch", "check", "cpu", "ram", "memory", "system", "pc", "search", "google", "volume", 
                    "play", "pause", "skip", "next", "previous", "stop", "resume", "song", "track", "music", "video",
                    "wifi", "password", "knowledge", "remember", "what is my", "tell me about", "dog", "pet", "favorite",
                    "write", "type", "code", "input", "paste",  # Typing keywords
-                   "weather", "temperature", "forecast", "climate"]  # Weather keywords
+                   "weather", "temperature", "forecast", "climate")  # Weather keywords
 
-QUESTION_STARTERS = ["what", "who", "where", "why", "when", "how", "explain", "tell", "can", "could", "would", "should", "please"]
+QUESTION_STARTERS = ("what", "who", "where", "why", "when", "how", "explain", "tell", "can", "could", "would", "should", "please")
@@ -2,18 +2,109 @@ import os
 import re
 import sys
 import json
+import time
+import atexit
+import threading
 from collections import deque
+from itertools import islice
 from colorama import Fore
 from langchain_groq import ChatGroq
 from langchain_ollama import ChatOllama
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
+# orjson is optional; it reads/writes the memory file several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 import config
-from core.tools import (open_application, get_system_status, google_search, system_volume,
-                   media_play_pause, media_next, media_previous, search_knowledge_base,
-                   get_current_time, get_weather, write_to_screen)
+from core.tools import TOOLS, TOOL_MAP
 from core.overlay import COLOR_SYSTEM_OK, COLOR_WARNING, COLOR_CRITICAL, COLOR_SUCCESS
 from core.memory import VectorMemory
+from core.cache import ResponseCache, SemanticCache
+
+DEBUG = getattr(config, 'DEBUG', False)
+
+# Earlier messages (besides the persona and retrieved memory) that a
+# cached reply is tied to; see _run_cloud_chat
+CACHE_CONTEXT = getattr(config, 'CACHE_CONTEXT', 2)
+
+# Tool results longer than this are shown on screen instead of read aloud
+SPOKEN_RESULT_LIMIT = getattr(config, 'SPOKEN_RESULT_LIMIT', 200)
+_SHORT_CONFIRMATIONS = {
+    "get_system_status": "System status is on screen, Sir.",
+    "get_weather": "The weather report is on screen, Sir.",
+    "search_knowledge_base": "Here is what I found, Sir. It's on screen.",
+    "write_to_screen": "Done, Sir. The text has been typed.",
+}
+
+def _keyword_pattern(keywords):
+    """Compile a keyword list into one whole-word alternation regex."""
+    return re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b')
+
+# Routing keyword classes, each scanned in a single regex pass.
+# Knowledge keywords check is less strict now that we have RAG,
+# but we keep it to force tool usage if explicitly asked.
+_SYSTEM_RE = _keyword_pattern(config.SYSTEM_KEYWORDS)
+_KNOWLEDGE_RE = _keyword_pattern(["what is my", "tell me about my", "my wifi", "my password",
+                                  "my name", "my favorite", "my dog", "my pet"])
+_WRITE_RE = _keyword_pattern(["write", "type", "paste", "input", "code it", "implement"])
+
+# Saved message "type" -> message class (the class name is the on-disk code)
+_MESSAGE_TYPES = {cls.__name__: cls for cls in (HumanMessage, AIMessage, SystemMessage)}
+
+_SUMMARY_PROMPT = SystemMessage(content="Summarize this conversation in 2-3 sentences. Focus on key facts and user preferences.")
+
+# Sentiment tags ([HAPPY], [ALERT], ...) that prefix cloud replies
+_SENTIMENT_TAG_RE = re.compile(r'\[.*?\]')
+_SENTIMENT_RE = re.compile(r'\[(HAPPY|ALERT|ERROR|NEUTRAL)\]')
+_SENTIMENT_COLORS = {"HAPPY": COLOR_SUCCESS, "ALERT": COLOR_WARNING, "ERROR": COLOR_CRITICAL}
+
+
+class SentenceAggregator:
+    """
+    Collects streamed LLM text and releases it one complete sentence at a time,
+    so speech can start before the whole reply has been generated.
+    """
+    _BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+    # Titles whose trailing period doesn't end a sentence
+    _ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "st.", "e.g.", "i.e.", "vs."}
+    # Fragments shorter than this are merged into the next sentence
+    MIN_LENGTH = 10
+
+    def __init__(self):
+        self._buffer = ""
+
+    def feed(self, text):
+        """Append a streamed chunk of text."""
+        self._buffer += text
+
+    def drain(self):
+        """Return the complete sentences buffered so far, keeping the remainder."""
+        parts = self._BOUNDARY_RE.split(self._buffer)
+        self._buffer = parts.pop()  # may still be mid-sentence
+        
+        sentences = []
+        pending = ""
+        for part in parts:
+            pending = f"{pending} {part}" if pending else part
+            if len(pending) < self.MIN_LENGTH or pending.rsplit(None, 1)[-1].lower() in self._ABBREVIATIONS:
+                continue
+            sentences.append(pending)
+            pending = ""
+        
+        if pending:
+            self._buffer = f"{pending} {self._buffer}" if self._buffer else pending
+        return sentences
+
+    def flush(self):
+        """Return whatever is left once the stream has ended."""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return [rest] if rest else []
+
 
 class AlfredBrain:
     """
@@ -32,8 +123,24 @@ class AlfredBrain:
         
         self.chat_memory = deque(maxlen=config.MAX_MEMORY_DEPTH)
         self.message_count = 0
+        # Guards chat_memory and message_count: the memory writer thread and
+        # the speech/UI callbacks can touch them while a turn is in progress
+        self._memory_lock = threading.RLock()
+        self.response_cache = ResponseCache(
+            max_entries=getattr(config, 'RESPONSE_CACHE_SIZE', 128),
+            ttl=getattr(config, 'RESPONSE_CACHE_TTL', 300)
+        )
         self.memory_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "long_term_memory.json")
         
+        # save_memory() only marks memory dirty; a background thread coalesces
+        # saves made within MEMORY_SAVE_DELAY seconds into one write
+        self._save_delay = getattr(config, 'MEMORY_SAVE_DELAY', 2.0)
+        self._memory_dirty = threading.Event()
+        # Serializes flushes: the writer thread and the atexit hook share one temp file
+        self._write_lock = threading.Lock()
+        threading.Thread(target=self._memory_writer, daemon=True, name="MemoryWriter").start()
+        atexit.register(self.flush_memory)
+        
         # Initialize Vector Memory (RAG) - Optional for performance
         print(Fore.YELLOW + "Initializing Memory Systems...")
         if getattr(config, 'ENABLE_VECTOR_MEMORY', True):
@@ -42,21 +149,35 @@ class AlfredBrain:
             print(Fore.CYAN + "⚡ Vector Memory disabled (saving RAM)")
             self.vector_memory = None
         
+        # Reworded repeats of a question; only active with an embedding model
+        # loaded, and then kept on disk so hits survive a restart
+        embeddings_enabled = bool(self.vector_memory and self.vector_memory.enabled)
+        self.semantic_cache = SemanticCache(
+            self.embed,
+            threshold=getattr(config, 'SEMANTIC_CACHE_THRESHOLD', 0.92),
+            ttl=getattr(config, 'SEMANTIC_CACHE_TTL', 3600),
+            max_entries=getattr(config, 'SEMANTIC_CACHE_SIZE', 256),
+            path=os.path.join(os.path.dirname(self.memory_file), "semantic_cache.db") if embeddings_enabled else None
+        )
+        
         # Initialize Models
         print(Fore.YELLOW + "Initializing Ajax System (Brain)...")
         try:
             self.cloud_brain = ChatGroq(model=config.CLOUD_MODEL, temperature=0.7)
+            # Created once so vision requests reuse the same client/connection pool
+            self.vision_model = ChatGroq(model=config.VISION_MODEL, temperature=0.5)
             
             # Local model is optional for performance
             if getattr(config, 'ENABLE_LOCAL_MODEL', True):
                 self.local_body = ChatOllama(model=config.LOCAL_MODEL, temperature=0)
                 
                 # Bind tools to Local Body
-                self.tools_list = [open_application, get_system_status, google_search, system_volume,
-                              media_play_pause, media_next, media_previous, search_knowledge_base,
-                              get_current_time, get_weather, write_to_screen]
+                self.tools_list = TOOLS
                 self.local_body_with_tools = self.local_body.bind_tools(self.tools_list)
-                print(Fore.CYAN + "✔ Systems Online (Cloud + Local + 11 Tools)")
+                print(Fore.CYAN + f"✔ Systems Online (Cloud + Local + {len(TOOLS)} Tools)")
+                
+                # Load the Ollama model in the background so the first command doesn't wait for it
+                threading.Thread(target=self._warm_up_local, daemon=True, name="OllamaWarmUp").start()
             else:
                 self.local_body = None
                 self.local_body_with_tools = None
@@ -67,6 +188,13 @@ class AlfredBrain:
         # Load Memory
         self.load_memory()
 
+    def _warm_up_local(self):
+        """Send the local model a trivial prompt so Ollama loads its weights now."""
+        try:
+            self.local_body.invoke([HumanMessage(content="hi")])
+        except Exception as e:
+            print(Fore.YELLOW + f"⚠ Local model warm-up failed: {e}")
+
     def load_memory(self):
         """Load chat memory from JSON file."""
         try:
@@ -74,58 +202,93 @@ class AlfredBrain:
                 print(Fore.CYAN + "No previous memory found. Starting fresh.")
                 return
             
-            with open(self.memory_file, 'r', encoding='utf-8') as f:
-                memory_data = json.load(f)
+            with open(self.memory_file, 'rb') as f:
+                data = f.read()
+            memory_data = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
-            self.chat_memory.clear()
-            for msg_dict in memory_data:
-                if msg_dict["type"] == "HumanMessage":
-                    self.chat_memory.append(HumanMessage(content=msg_dict["content"]))
-                elif msg_dict["type"] == "AIMessage":
-                    self.chat_memory.append(AIMessage(content=msg_dict["content"]))
-                elif msg_dict["type"] == "SystemMessage":
-                    self.chat_memory.append(SystemMessage(content=msg_dict["content"]))
+            # The deque keeps only the newest maxlen messages anyway, so
+            # don't build message objects for older ones
+            with self._memory_lock:
+                self.chat_memory.clear()
+                for msg_dict in memory_data[-self.chat_memory.maxlen:]:
+                    message_type = _MESSAGE_TYPES.get(msg_dict["type"])
+                    if message_type:
+                        self.chat_memory.append(message_type(content=msg_dict["content"]))
+                loaded = len(self.chat_memory)
             
-            print(Fore.GREEN + f"✔ Loaded {len(memory_data)} messages from previous session")
+            print(Fore.GREEN + f"✔ Loaded {loaded} messages from previous session")
         except Exception as e:
             print(Fore.YELLOW + f"Warning: Could not load memory: {e}") 
 
+    def _memory_snapshot(self):
+        """Return a consistent copy of chat memory."""
+        with self._memory_lock:
+            return list(self.chat_memory)
+
+    def _remember(self, message):
+        """Append a message to chat memory."""
+        with self._memory_lock:
+            self.chat_memory.append(message)
+
     def save_memory(self):
-        """Save chat memory to JSON file."""
+        """Schedule chat memory to be written to disk (debounced, off the hot path)."""
+        self._memory_dirty.set()
+
+    def flush_memory(self):
+        """Write pending chat memory to disk immediately."""
+        with self._write_lock:
+            if self._memory_dirty.is_set():
+                self._memory_dirty.clear()
+                self._write_memory()
+
+    def _memory_writer(self):
+        """Background thread: wait for save requests and write them in batches."""
+        while True:
+            self._memory_dirty.wait()
+            time.sleep(self._save_delay)
+            self.flush_memory()
+
+    def _write_memory(self):
+        """Save chat memory to JSON file (atomically replaces the old file)."""
         try:
-            memory_data = []
-            for msg in self.chat_memory:
-                msg_dict = {
-                    "type": msg.__class__.__name__,
-                    "content": msg.content
-                }
-                memory_data.append(msg_dict)
+            memory_data = [{"type": type(msg).__name__, "content": msg.content}
+                           for msg in self._memory_snapshot()]
             
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.memory_file), exist_ok=True)
             
-            with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(memory_data, f, indent=2)
+            # Write a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated memory file behind
+            # Compact output unless debugging (pretty-printing roughly doubles the cost)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(memory_data, option=orjson.OPT_INDENT_2 if DEBUG else 0)
+            else:
+                data = json.dumps(memory_data, indent=2 if DEBUG else None, ensure_ascii=False).encode('utf-8')
+            
+            temp_file = self.memory_file + ".tmp"
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, self.memory_file)
         except Exception as e:
             print(Fore.YELLOW + f"Warning: Could not save memory: {e}")
 
     def summarize_conversation(self):
         """Summarizes conversation to save tokens."""
-        if len(self.chat_memory) < 5:
+        history = self._memory_snapshot()
+        if len(history) < 5:
             return
         
         print(Fore.MAGENTA + "🔄 Optimizing memory (summarizing conversation)...")
         try:
-            conversation_text = "\n".join([f"{msg.__class__.__name__}: {msg.content}" for msg in self.chat_memory])
-            summary_prompt = SystemMessage(content="Summarize this conversation in 2-3 sentences. Focus on key facts and user preferences.")
-            
-            response = self.cloud_brain.invoke([summary_prompt, HumanMessage(content=f"Conversation:\n{conversation_text}")])
+            conversation_text = "\n".join(f"{type(msg).__name__}: {msg.content}" for msg in history)
+            response = self.cloud_brain.invoke([_SUMMARY_PROMPT, HumanMessage(content=f"Conversation:\n{conversation_text}")])
             summary = response.content
             
             print(Fore.GREEN + f"✓ Memory optimized. Summary: {summary[:60]}...")
-            self.chat_memory.clear()
-            self.chat_memory.append(SystemMessage(content=f"Previous conversation summary: {summary}"))
-            self.message_count = 0
+            with self._memory_lock:
+                self.chat_memory.clear()
+                self.chat_memory.append(SystemMessage(content=f"Previous conversation summary: {summary}"))
+                self.message_count = 0
             
             # Store summary in Vector DB as well
             if self.vector_memory and self.vector_memory.enabled:
@@ -134,9 +297,14 @@ class AlfredBrain:
         except Exception as e:
             print(Fore.YELLOW + f"⚠ Summarization failed: {e}")
 
-    def process_vision(self, user_input, image_data, ui_callback=None):
-        """Handles vision-related requests."""
+    def process_vision(self, user_input, image_data, ui_callback=None, on_sentence=None):
+        """
+        Handles vision-related requests.
+        If on_sentence is given, the description is passed to it sentence by
+        sentence as it streams in (except when code is to be pasted).
+        """
         print(Fore.MAGENTA + "👀 Vision Mode Activated...")
+        wants_code = bool(_WRITE_RE.search(user_input.lower()))
         
         msg = HumanMessage(
             content=[
@@ -146,23 +314,24 @@ class AlfredBrain:
         )
         
         try:
-            vision_model = ChatGroq(model=config.VISION_MODEL, temperature=0.5)
-            response = vision_model.invoke([msg])
-            content = response.content
+            if on_sentence and not wants_code:
+                chunks = (chunk.content for chunk in self.vision_model.stream([msg]))
+                content = self._stream_cloud_reply(chunks, on_sentence)
+            else:
+                content = self.vision_model.invoke([msg]).content
             print(Fore.CYAN + f"[Vision]: {content}")
             
             if ui_callback:
                 ui_callback(content, COLOR_SYSTEM_OK)
                 
-            self.chat_memory.append(HumanMessage(content=f"User showed an image. You saw: {content}"))
+            self._remember(HumanMessage(content=f"User showed an image. You saw: {content}"))
             
             # Check for code extraction
-            write_keywords = ["write", "type", "paste", "input", "code it", "implement"]
-            if any(k in user_input.lower() for k in write_keywords):
+            if wants_code:
                 code_match = re.search(r'```(?:python|cpp|java|javascript)?\n(.*?)```', content, re.DOTALL)
                 if code_match:
                     code = code_match.group(1).strip()
-                    write_to_screen.invoke({"text": code})
+                    TOOL_MAP["write_to_screen"].invoke({"text": code})
                     return f"{content}\n(Code pasted successfully)"
             
             return content
@@ -170,50 +339,48 @@ class AlfredBrain:
             print(Fore.RED + f"Vision Error: {e}")
             return "I had trouble seeing that."
 
-    def think(self, user_input, ui_callback=None):
+    def think(self, user_input, ui_callback=None, on_sentence=None):
         """
         Main decision loop.
         Arguments:
             user_input (str): The text query from the user.
             ui_callback (func): Function to update the GUI (text, color).
+            on_sentence (func): Optional. Called with each sentence of a cloud
+                reply as it streams in (e.g. to start speaking early).
         Returns:
             str: The response text (or tool output).
         """
-        print(Fore.WHITE + f"DEBUG: Processing input -> '{user_input}'")
+        if DEBUG:
+            print(Fore.WHITE + f"DEBUG: Processing input -> '{user_input}'")
         
         # Add to memory
-        self.chat_memory.append(HumanMessage(content=user_input))
-        self.message_count += 1
-        if self.message_count >= 10:
+        with self._memory_lock:
+            self.chat_memory.append(HumanMessage(content=user_input))
+            self.message_count += 1
+            needs_summary = self.message_count >= 10
+        if needs_summary:
             self.summarize_conversation()
             
-        # Routing Logic
-        system_keywords = config.SYSTEM_KEYWORDS
-        question_starters = config.QUESTION_STARTERS
-        
-        # Knowledge keywords check is less strict now that we have RAG, 
-        # but we keep it to force tool usage if explicitly asked.
-        knowledge_keywords = ["what is my", "tell me about my", "my wifi", "my password", 
-                             "my name", "my favorite", "my dog", "my pet"]
-        
-        has_keyword = any(k in user_input.lower() for k in system_keywords)
-        needs_knowledge = any(k in user_input.lower() for k in knowledge_keywords)
+        # Routing Logic (whole-word matches, so e.g. "pc" doesn't fire on "epic")
+        ui_lower = user_input.lower()
+        has_keyword = bool(_SYSTEM_RE.search(ui_lower))
+        needs_knowledge = bool(_KNOWLEDGE_RE.search(ui_lower))
 
         # LOCAL ROUTE (Tools)
         if has_keyword or needs_knowledge:
-            return self._run_local_tools(user_input, ui_callback)
+            return self._run_local_tools(user_input, ui_callback, on_sentence)
         
         # CLOUD ROUTE (Chat)
         else:
-            return self._run_cloud_chat(user_input, ui_callback)
+            return self._run_cloud_chat(user_input, ui_callback, on_sentence)
 
-    def _run_local_tools(self, user_input, ui_callback):
+    def _run_local_tools(self, user_input, ui_callback, on_sentence=None):
         print(Fore.YELLOW + "⚡ Routing to LOCAL SYSTEM...")
         
         # If local model is disabled, fall back to cloud for tool-like requests
         if self.local_body_with_tools is None:
             print(Fore.CYAN + "⚡ Local model disabled, using cloud fallback for tools")
-            return self._run_cloud_chat(user_input, ui_callback)
+            return self._run_cloud_chat(user_input, ui_callback, on_sentence)
         
         system_instruction = SystemMessage(content="""
         You are a PC Automation Agent. USE TOOLS directly.
@@ -230,9 +397,11 @@ class AlfredBrain:
         Do not reply with just text if a tool fits.
         """)
         
-        recent_memory = list(self.chat_memory)[-5:]
+        # Last 5 messages only, without copying the whole deque first
+        with self._memory_lock:
+            recent_memory = list(islice(self.chat_memory, max(0, len(self.chat_memory) - 5), None))
         try:
-            ai_msg = self.local_body_with_tools.invoke([system_instruction] + recent_memory)
+            ai_msg = self.local_body_with_tools.invoke([system_instruction, *recent_memory])
             
             # Execute Tools
             if ai_msg.tool_calls:
@@ -253,12 +422,16 @@ class AlfredBrain:
                     elif "not found" in str(tool_result).lower():
                         color = COLOR_WARNING
                         
+                    response = f"Done. {tool_result}"
                     if ui_callback:
-                        ui_callback(f"Done. {tool_result}", color)
+                        ui_callback(response, color)
+                        # Long results are read on screen; only a short confirmation is spoken
+                        if len(str(tool_result)) > SPOKEN_RESULT_LIMIT:
+                            response = _SHORT_CONFIRMATIONS.get(tool_name, "Done, Sir. The details are on screen.")
                         
-                    self.chat_memory.append(AIMessage(content=f"[System]: {tool_result}"))
+                    self._remember(AIMessage(content=f"[System]: {tool_result}"))
                     self.save_memory()
-                    return f"Done. {tool_result}"
+                    return response
             
             # No tool called
             response = ai_msg.content or "I'm not sure how to help with that."
@@ -271,23 +444,17 @@ class AlfredBrain:
             print(Fore.RED + error_msg)
             return error_msg
 
+    def embed(self, text):
+        """Sentence embedding of text, or None when no embedding model is loaded."""
+        if self.vector_memory and self.vector_memory.enabled:
+            return self.vector_memory.embedder.encode(text)
+        return None
+
     def _dispatch_tool(self, name, args):
         """Map tool name to function."""
-        tool_map = {
-            "open_application": open_application,
-            "get_system_status": get_system_status,
-            "google_search": google_search,
-            "system_volume": system_volume,
-            "media_play_pause": media_play_pause,
-            "media_next": media_next,
-            "media_previous": media_previous,
-            "search_knowledge_base": search_knowledge_base,
-            "get_current_time": get_current_time,
-            "get_weather": get_weather,
-            "write_to_screen": write_to_screen
-        }
-        if name in tool_map:
-            return tool_map[name].invoke(args)
+        tool = TOOL_MAP.get(name)
+        if tool:
+            return tool.invoke(args)
         return "Unknown Tool"
 
     def _extract_and_save_facts(self, user_input):
@@ -314,7 +481,27 @@ class AlfredBrain:
                 print(Fore.MAGENTA + f"⚡ Auto-Memorizing Fact: '{fact}'")
                 self.vector_memory.add_knowledge(fact, category="auto_extracted")
 
-    def _run_cloud_chat(self, user_input, ui_callback):
+    def _stream_cloud_reply(self, chunks, on_sentence):
+        """Collect streamed text chunks, passing each finished sentence to on_sentence."""
+        aggregator = SentenceAggregator()
+        parts = []
+        
+        def emit(sentences):
+            for sentence in sentences:
+                # Sentiment tags are for the UI, not for speech
+                sentence = _SENTIMENT_TAG_RE.sub('', sentence).strip()
+                if sentence:
+                    on_sentence(sentence)
+        
+        for text in chunks:
+            parts.append(text)
+            aggregator.feed(text)
+            emit(aggregator.drain())
+        emit(aggregator.flush())
+        
+        return "".join(parts)
+
+    def _run_cloud_chat(self, user_input, ui_callback, on_sentence=None):
         print(Fore.MAGENTA + "☁️ Routing to CLOUD BRAIN...")
         
         # 1. RAG: Retrieve Context
@@ -339,23 +526,49 @@ class AlfredBrain:
             
             persona = SystemMessage(content=persona_content)
             
-            messages = [persona] + list(self.chat_memory)
-            response = self.cloud_brain.invoke(messages)
-            content = response.content
+            with self._memory_lock:
+                messages = [persona, *self.chat_memory]
+            
+            # Identical prompt -> reuse the earlier reply, then try a reworded
+            # version of the same question. Both must share the persona/retrieved
+            # memory and the last few messages (not the whole, ever-growing
+            # history), so a repeat hits later in the session while a follow-up
+            # ("tell me more") is never answered from another conversation.
+            history = messages[1:-1][-CACHE_CONTEXT:] if CACHE_CONTEXT else []
+            cache_key = ResponseCache.make_key([persona, *history, messages[-1]], config.CLOUD_MODEL)
+            semantic_context = ResponseCache.make_key([persona, *history], config.CLOUD_MODEL).hex()
+            content = self.response_cache.get(cache_key)
+            if content is None:
+                content = self.semantic_cache.get(user_input, semantic_context)
+            if content is not None:
+                print(Fore.CYAN + "⚡ Using cached response")
+                if on_sentence:
+                    self._stream_cloud_reply([content], on_sentence)
+            else:
+                if on_sentence:
+                    chunks = (chunk.content for chunk in self.cloud_brain.stream(messages))
+                    content = self._stream_cloud_reply(chunks, on_sentence)
+                else:
+                    content = self.cloud_brain.invoke(messages).content
+                self.response_cache.put(cache_key, content)
+                self.semantic_cache.put(user_input, content, semantic_context)
             
-            # Sentiment Color Parsing
+            # Sentiment Color Parsing (the tag leads the reply, so only look there)
             sentiment_color = COLOR_SYSTEM_OK
-            if "[HAPPY]" in content: sentiment_color = COLOR_SUCCESS
-            elif "[ALERT]" in content: sentiment_color = COLOR_WARNING
-            elif "[ERROR]" in content: sentiment_color = COLOR_CRITICAL
+            clean_content = content.strip()
+            if clean_content.startswith('['):
+                match = _SENTIMENT_RE.match(clean_content)
+                if match:
+                    sentiment_color = _SENTIMENT_COLORS.get(match.group(1), COLOR_SYSTEM_OK)
             
             # Clean content
-            clean_content = re.sub(r'\[.*?\]', '', content).strip()
+            if '[' in clean_content:
+                clean_content = _SENTIMENT_TAG_RE.sub('', clean_content).strip()
             
             if ui_callback:
                 ui_callback(clean_content, sentiment_color)
                 
-            self.chat_memory.append(AIMessage(content=content))
+            self._remember(AIMessage(content=content))
             self.save_memory()
             
             # Save conversation loop to vector memory for future recall
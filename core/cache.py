@@ -0,0 +1,256 @@
+"""
+Response cache for ALFRED.
+Remembers recent LLM replies so an identical request (same prompt, same
+last few messages) is answered without another round-trip to the model.
+SemanticCache does the same for reworded requests, by embedding similarity.
+"""
+
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class ResponseCache:
+    """
+    Small in-memory LRU cache of LLM replies with a time-to-live.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of replies kept (least recently used go first)
+            ttl: Seconds a reply stays valid
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, reply)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(messages, model: str = "") -> bytes:
+        """
+        Build a cache key from a list of chat messages.
+
+        Messages aren't hashable, so the key is a digest of the model name and
+        each message's type and content, in order. Content is compared with
+        case and extra whitespace ignored ("Play music " == "play music"),
+        and switching models gives new keys.
+        """
+        digest = hashlib.blake2b(model.encode("utf-8"), digest_size=16)
+        for msg in messages:
+            digest.update(b"\x02")
+            digest.update(type(msg).__name__.encode())
+            digest.update(b"\x00")
+            digest.update(" ".join(str(msg.content).split()).casefold().encode("utf-8"))
+            digest.update(b"\x01")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached reply for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, reply = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return reply
+
+    def put(self, key: bytes, reply: str):
+        """Store a reply, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, reply)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached replies."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SemanticCache:
+    """
+    Reuses replies for prompts that mean the same thing
+    ("what's the capital of France" / "tell me France's capital").
+
+    Prompt embeddings are kept as unit-length rows of one numpy matrix, so a
+    lookup is a single matrix-vector product (cosine similarity) and argmax.
+    When full, the oldest entry is overwritten.
+
+    Given a path, entries are also written to an SQLite database (one row per
+    matrix slot) and reloaded on start-up, so the cache survives restarts.
+
+    Each entry belongs to a context (e.g. the conversation leading up to the
+    prompt) and only matches lookups made in the same context, so a short
+    follow-up like "tell me more" never gets a reply from another conversation.
+    """
+
+    def __init__(self, embed_fn: Callable, threshold: float = 0.92,
+                 ttl: float = 3600.0, max_entries: int = 256, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Maps text to an embedding vector, or None if unavailable
+            threshold: Minimum cosine similarity that counts as the same prompt
+            ttl: Seconds a reply stays valid
+            max_entries: Maximum number of replies kept
+            path: Optional SQLite file to persist entries in
+        """
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._matrix = None       # (max_entries, dim) float32, allocated on first put
+        self._expires = np.zeros(max_entries, dtype=np.float64)
+        self._replies = [None] * max_entries
+        self._contexts = np.zeros(max_entries, dtype=np.int64)  # see _context_id
+        self._count = 0
+        self._next = 0            # row overwritten by the next put
+        self._last = (None, None) # (prompt, vector) of the last embedding
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._open_db(path)
+
+    def _open_db(self, path: str):
+        """Open (or create) the SQLite store and load unexpired entries."""
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # WAL + NORMAL: a put is an append to the log, without an fsync per write
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "id INTEGER PRIMARY KEY, prompt TEXT, response TEXT, embedding BLOB, ts REAL, context INTEGER)"
+        )
+        # Stores from before contexts existed: add the column (their rows stay
+        # NULL and are never loaded, as they could match any conversation)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(cache)")}
+        if "context" not in columns:
+            self._db.execute("ALTER TABLE cache ADD COLUMN context INTEGER")
+        self._db.commit()
+
+        rows = self._db.execute(
+            "SELECT id, response, embedding, ts, context FROM cache WHERE id < ? ORDER BY ts DESC",
+            (self.max_entries,)
+        ).fetchall()
+        if not rows:
+            return
+
+        now = time.time()
+        dim = len(rows[0][2]) // 4  # float32 blobs; newest entry sets the width
+        self._matrix = np.zeros((self.max_entries, dim), dtype=np.float32)
+        for row_id, response, blob, ts, context in rows:
+            if len(blob) != dim * 4 or ts + self.ttl < now or context is None:
+                continue
+            self._matrix[row_id] = np.frombuffer(blob, dtype=np.float32)
+            self._expires[row_id] = ts + self.ttl
+            self._replies[row_id] = response
+            self._contexts[row_id] = context
+            self._count = max(self._count, row_id + 1)
+        self._next = (rows[0][0] + 1) % self.max_entries
+
+    def _embed(self, prompt: str):
+        """Unit-length float32 embedding of prompt (reuses the last one)."""
+        last_prompt, last_vec = self._last
+        if prompt == last_prompt:
+            return last_vec
+
+        vec = self.embed_fn(prompt)
+        if vec is not None:
+            vec = np.asarray(vec, dtype=np.float32).ravel()
+            norm = np.linalg.norm(vec)
+            vec = vec / norm if norm else None
+        self._last = (prompt, vec)
+        return vec
+
+    @staticmethod
+    def _context_id(context: str) -> int:
+        """64-bit digest of a context string (stored per entry, compared as one array)."""
+        digest = hashlib.blake2b(context.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little", signed=True)
+
+    def get(self, prompt: str, context: str = "") -> Optional[str]:
+        """Return the reply cached for a similar prompt in the same context, or None."""
+        vec = self._embed(prompt)
+        if vec is None:
+            return None
+        context_id = self._context_id(context)
+
+        with self._lock:
+            n = self._count
+            if n == 0:
+                return None
+
+            scores = self._matrix[:n] @ vec
+            scores[self._expires[:n] < time.time()] = -1.0
+            scores[self._contexts[:n] != context_id] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return self._replies[best]
+
+    def put(self, prompt: str, reply: str, context: str = ""):
+        """Store a reply for prompt, made in the given context."""
+        vec = self._embed(prompt)
+        if vec is None:
+            return
+        context_id = self._context_id(context)
+
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != len(vec):
+                self._matrix = np.zeros((self.max_entries, len(vec)), dtype=np.float32)
+                self._count = self._next = 0
+
+            row = self._next
+            now = time.time()
+            self._matrix[row] = vec
+            self._expires[row] = now + self.ttl
+            self._replies[row] = reply
+            self._contexts[row] = context_id
+            self._next = (row + 1) % self.max_entries
+            self._count = min(self._count + 1, self.max_entries)
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (id, prompt, response, embedding, ts, context) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (row, prompt, reply, vec.tobytes(), now, context_id)
+                )
+                self._db.commit()
+
+    def clear(self):
+        """Drop all cached replies."""
+        with self._lock:
+            self._count = self._next = 0
+            self._replies = [None] * self.max_entries
+            self._expires[:] = 0.0
+            if self._db is not None:
+                self._db.execute("DELETE FROM cache")
+                self._db.commit()
+
+    def close(self):
+        """Close the SQLite store, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self):
+        return self._count
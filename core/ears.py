@@ -1,7 +1,10 @@
 import sounddevice as sd
 import numpy as np
-import wave
 import os
+import time
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 from faster_whisper import WhisperModel
 from colorama import Fore
@@ -20,66 +23,170 @@ except ImportError:
 try:
     import config
     MODEL_SIZE = config.WHISPER_SIZE  # Use config value (tiny.en) to save RAM
+    COMPUTE_TYPE = getattr(config, 'WHISPER_COMPUTE_TYPE', "auto")
 except ImportError:
     MODEL_SIZE = "tiny.en"  # Fallback to tiny model
+    COMPUTE_TYPE = "auto"
+
+# Environment overrides for deployment-specific tuning
+MODEL_SIZE = os.getenv("ALFRED_WHISPER_MODEL", MODEL_SIZE)
+COMPUTE_TYPE = os.getenv("ALFRED_WHISPER_COMPUTE_TYPE", COMPUTE_TYPE)
 
 CHANNELS = 1
 RATE = 16000
 CHUNK = 1024
+# OpenWakeWord scores audio in 80 ms frames (1280 samples at 16 kHz);
+# reading exactly one frame per predict() avoids partial-frame calls
+WAKE_WORD_CHUNK = 1280
 
 # Dynamic Thresholding Defaults
 INITIAL_THRESHOLD = 500
 MIN_THRESHOLD = 300
 SILENCE_DURATION = 1.5   # Seconds of silence to consider "Done speaking"
 NOISE_ADJUST_RATE = 0.05 # How fast we adapt to background noise
+RECORD_BUFFER_SECONDS = 30 # Initial capacity of the command recording buffer
+
+# int16 PCM -> float32 in [-1, 1)
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+# Consecutive quiet chunks that end a command
+SILENCE_CHUNKS = int(SILENCE_DURATION * RATE / CHUNK)
 
-print(Fore.YELLOW + "Loading Ears (Whisper Model)...")
-# running on CPU with int8 quantization for speed
-model = WhisperModel(MODEL_SIZE, device="cpu", compute_type="int8")
+# Scratch buffer for the per-chunk volume calculation (reused every read).
+# Viewed as uint16 so abs(-32768) doesn't wrap back to a negative value.
+_abs_buffer = np.empty(CHUNK, dtype=np.int16)
+_abs_unsigned = _abs_buffer.view(np.uint16)
 
-# Initialize Wake Word Detector
+def _chunk_volume(samples):
+    """Mean absolute amplitude of an int16 chunk, without temporary arrays."""
+    n = len(samples)
+    np.abs(samples, out=_abs_buffer[:n])
+    return np.add.reduce(_abs_unsigned[:n], dtype=np.uint64) / n
+
+# Whisper model and wake word detector, loaded by load_models() (main.py
+# calls it on a loader thread so the overlay is up while they load)
+model = None
 detector = None
-if OPENWAKEWORD_AVAILABLE:
+_models_lock = threading.Lock()
+
+def _warm_up_whisper():
+    """Transcribe one second of silence so first-use setup isn't paid on the first command."""
     try:
-        from core.wake_word import WakeWordDetector
-        import config
-        detector = WakeWordDetector()
-        
+        segments, _ = model.transcribe(np.zeros(RATE, dtype=np.float32), beam_size=1, language="en")
+        for _ in segments:  # segments are lazy; consume them to actually run the model
+            pass
     except Exception as e:
-        print(Fore.YELLOW + f"⚠ Could not initialize wake word detector: {e}")
+        print(Fore.YELLOW + f"⚠ Whisper warm-up failed: {e}")
+
+def load_models():
+    """Load the Whisper model and wake word detector (once; later calls return at once)."""
+    global model, detector
+    with _models_lock:
+        if model is not None:
+            return
+        
+        print(Fore.YELLOW + "Loading Ears (Whisper Model)...")
+        # Running on CPU; "auto" lets CTranslate2 pick the fastest quantization it supports
+        model = WhisperModel(
+            MODEL_SIZE,
+            device="cpu",
+            compute_type=COMPUTE_TYPE,
+            cpu_threads=os.cpu_count() or 4,
+            num_workers=1
+        )
+        threading.Thread(target=_warm_up_whisper, daemon=True, name="WhisperWarmUp").start()
+        
+        # Initialize Wake Word Detector
+        if OPENWAKEWORD_AVAILABLE:
+            try:
+                from core.wake_word import WakeWordDetector
+                detector = WakeWordDetector()
+                
+            except Exception as e:
+                print(Fore.YELLOW + f"⚠ Could not initialize wake word detector: {e}")
+
+def wake_word_ready():
+    """True when the OpenWakeWord detector is loaded and usable."""
+    return OPENWAKEWORD_AVAILABLE and detector is not None and detector.enabled
 
-def listen_for_wake_word(wake_word="jarvis", timeout=None):
+# Shared microphone stream, opened on first use and kept running for the
+# lifetime of the process (avoids re-initializing the device every cycle)
+_stream = None
+# Held while reading from the shared stream, so a background wake word
+# listener and command recording never consume the same audio
+_STREAM_LOCK = threading.RLock()
+
+def _get_stream():
+    """Return the shared input stream, opening it if needed."""
+    global _stream
+    if _stream is None:
+        _stream = sd.InputStream(samplerate=RATE, channels=CHANNELS, dtype='int16', blocksize=CHUNK)
+        _stream.start()
+        atexit.register(_close_stream)
+    return _stream
+
+def _close_stream():
+    """Stop and release the shared input stream."""
+    global _stream
+    if _stream is not None:
+        _stream.stop()
+        _stream.close()
+        _stream = None
+
+def _drain(stream):
+    """Discard audio buffered since the last read (e.g. while Alfred was talking)."""
+    available = stream.read_available
+    if available:
+        stream.read(available)
+
+def _append_audio(buffer, length, chunk):
+    """Copy chunk into buffer at length, doubling the buffer if it is full."""
+    end = length + len(chunk)
+    if end > len(buffer):
+        grown = np.empty(max(end, 2 * len(buffer)), dtype=buffer.dtype)
+        grown[:length] = buffer[:length]
+        buffer = grown
+    buffer[length:end] = chunk
+    return buffer, end
+
+def listen_for_wake_word(wake_word="jarvis", timeout=None, stop_event=None):
     """
     Efficiently listens for the wake word using OpenWakeWord (via WakeWordDetector).
     Falls back to Whisper if OpenWakeWord is not available.
+    
+    Returns False on timeout, or as soon as stop_event (a threading.Event) is set.
     """
     # Fallback to Whisper if detector is not ready
-    if not OPENWAKEWORD_AVAILABLE or detector is None or not detector.enabled:
-        text = listen_and_transcribe()
+    if not wake_word_ready():
+        text = listen_and_transcribe(stop_event)
         return wake_word.lower() in text.lower() if text else False
     
     # Efficient wake word detection
     print(Fore.WHITE + f"🎧 Listening for '{wake_word}'...")
     
     try:
-        import time 
-        with sd.InputStream(samplerate=RATE, channels=CHANNELS, dtype='int16', blocksize=CHUNK) as stream:
-            start_time = time.time() if timeout else None
+        with _STREAM_LOCK:
+            stream = _get_stream()
+            _drain(stream)
+            deadline = time.monotonic() + timeout if timeout else None
             
             while True:
-                # Check timeout
-                if timeout and (time.time() - start_time) > timeout:
+                # Check timeout / external stop request
+                if deadline and time.monotonic() > deadline:
                     return False
+                if stop_event is not None and stop_event.is_set():
+                    return False
+                
+                # Read one detector frame
+                data, overflowed = stream.read(WAKE_WORD_CHUNK)
                 
                 # Check for self-talk (Echo Cancellation)
-                if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+                if pygame.mixer.get_init() and pygame.mixer.get_busy():
                     # If Alfred is speaking, we shouldn't trigger wake word on his own voice
-                    sd.sleep(100) 
                     continue
-
-                # Read audio chunk
-                data, overflowed = stream.read(CHUNK)
-                audio_array = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+                
+                # OpenWakeWord expects raw 16-bit PCM
+                audio_array = np.frombuffer(data, dtype=np.int16)
                 
                 # Run wake word detection
                 if detector.detect(audio_array, threshold=config.WAKE_WORD_THRESHOLD):
@@ -90,14 +197,21 @@ def listen_for_wake_word(wake_word="jarvis", timeout=None):
         print(Fore.RED + f"Wake word detection error: {e}")
         return False
 
-def listen_and_transcribe():
+# Transcriptions run one at a time on this thread (see transcribe_async)
+_asr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ASR")
+
+def record_command(stop_event=None):
     """
     Records audio with DYNAMIC NOISE THRESHOLDING.
     Adaptively ignores background noise and waits for speech.
+    Returns the speech as 16 kHz float32 PCM, or None if nothing was recorded
+    or stop_event (a threading.Event) was set.
     """
     print(Fore.WHITE + "🎤 Listening... (Speak now)")
     
-    audio_data = []
+    # Recorded speech is written straight into one contiguous buffer
+    audio_data = np.empty(RECORD_BUFFER_SECONDS * RATE, dtype=np.int16)
+    recorded = 0
     silent_chunks = 0
     has_spoken = False
     
@@ -105,10 +219,17 @@ def listen_and_transcribe():
     current_threshold = INITIAL_THRESHOLD
     noise_level = INITIAL_THRESHOLD / 2  # Estimate noise floor
     
-    with sd.InputStream(samplerate=RATE, channels=CHANNELS, dtype='int16') as stream:
+    with _STREAM_LOCK:
+        stream = _get_stream()
+        _drain(stream)
+    
         while True:
+            # External stop request
+            if stop_event is not None and stop_event.is_set():
+                return None
+            
             # 1. Check for Self-Talking (Software Echo Cancellation)
-            if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+            if pygame.mixer.get_init() and pygame.mixer.get_busy():
                 # Alfred is speaking. Pause listening effectively.
                 # We consume the text to empty buffer but don't process it as speech
                 stream.read(CHUNK) 
@@ -117,10 +238,10 @@ def listen_and_transcribe():
             # 2. Read Audio
             data, overflowed = stream.read(CHUNK)
             np_data = np.frombuffer(data, dtype=np.int16)
-            
-            # 3. Calculate Volume (RMS-like)
-            volume = np.abs(np_data).mean()
-            
+        
+            # 3. Calculate Volume (mean absolute amplitude)
+            volume = _chunk_volume(np_data)
+        
             # 4. Dynamic Threshold Logic
             if not has_spoken:
                 # While waiting for speech, adapt to noise
@@ -128,56 +249,70 @@ def listen_and_transcribe():
                     # Slowly lowercase threshold or raise it to match noise
                     noise_level = (noise_level * (1 - NOISE_ADJUST_RATE)) + (volume * NOISE_ADJUST_RATE)
                     current_threshold = max(MIN_THRESHOLD, noise_level * 2.5) # Threshold is 2.5x noise floor
-            
+        
             # 5. Speech Detection
             if volume > current_threshold:
                 if not has_spoken:
                     print(Fore.GREEN + "⚡ Speech detected...")
                 has_spoken = True
                 silent_chunks = 0
-                audio_data.append(data)
+                audio_data, recorded = _append_audio(audio_data, recorded, np_data)
             elif has_spoken:
                 # We are in a "pause" after speech
                 silent_chunks += 1
-                audio_data.append(data) # Keep recording trails
-            
+                audio_data, recorded = _append_audio(audio_data, recorded, np_data) # Keep recording trails
+        
             # 6. Silence Timeout
-            chunks_per_second = RATE / CHUNK
-            if has_spoken and silent_chunks > (SILENCE_DURATION * chunks_per_second):
+            if has_spoken and silent_chunks > SILENCE_CHUNKS:
                 break
-                
+            
             # timeout if nothing heard for too long? (Optional)
-    
-    if not audio_data:
-        return ""
 
+    if not recorded:
+        return None
+
+    # Whisper takes 16 kHz float32 PCM directly - no temporary WAV file
+    pcm = audio_data[:recorded].astype(np.float32)
+    pcm *= _INT16_SCALE  # scale in place, no second array
+    return pcm
+
+def transcribe(pcm):
+    """Transcribe 16 kHz float32 PCM with Whisper. Returns the text ("" on failure)."""
     print(Fore.YELLOW + "Processing audio...")
     
-    # Save to temporary WAV file
-    filename = "temp_command.wav"
-    with wave.open(filename, 'wb') as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2) # 2 bytes (16 bit)
-        wf.setframerate(RATE)
-        wf.writeframes(b''.join(audio_data))
-    
-    # Transcribe
     try:
-        segments, info = model.transcribe(filename, beam_size=1)
+        # Short English commands: no language detection pass, no timestamp
+        # tokens and no prompt carried between segments
+        segments, info = model.transcribe(
+            pcm,
+            beam_size=1,
+            language="en",
+            condition_on_previous_text=False,
+            without_timestamps=True,
+            vad_filter=False
+        )
         full_text = "".join([segment.text for segment in segments]).strip()
     except Exception as e:
         print(Fore.RED + f"Transcription Error: {e}")
         full_text = ""
-    
-    # Clean up
-    if os.path.exists(filename):
-        os.remove(filename)
         
     return full_text
 
+def transcribe_async(pcm):
+    """Start transcribing pcm on the ASR thread. Returns a Future for the text."""
+    return _asr_executor.submit(transcribe, pcm)
+
+def listen_and_transcribe(stop_event=None):
+    """Record one command and transcribe it. Returns "" if nothing was heard."""
+    pcm = record_command(stop_event)
+    if pcm is None:
+        return ""
+    return transcribe(pcm)
+
 # Quick test if you run this file directly
 if __name__ == "__main__":
     pygame.mixer.init() # Needed for busy check mock
+    load_models()
     if OPENWAKEWORD_AVAILABLE:
         print("Testing wake word detection...")
         if listen_for_wake_word("jarvis", timeout=10):
@@ -37,29 +37,31 @@ def derive_key(password: str, salt: bytes = DEFAULT_SALT) -> bytes:
     return key
 
 
-def encrypt_content(content: str, password: str) -> bytes:
+def encrypt_content(content: str, password: str, key: bytes = None) -> bytes:
     """
     Encrypts string content using Fernet encryption.
     
     Args:
         content: Plain text to encrypt
         password: Encryption password
+        key: Optional key from derive_key(password), to skip re-deriving it
     
     Returns:
         Encrypted bytes
     """
-    key = derive_key(password)
+    key = key or derive_key(password)
     fernet = Fernet(key)
     return fernet.encrypt(content.encode('utf-8'))
 
 
-def decrypt_content(encrypted_data: bytes, password: str) -> str:
+def decrypt_content(encrypted_data: bytes, password: str, key: bytes = None) -> str:
     """
     Decrypts Fernet-encrypted content.
     
     Args:
         encrypted_data: Encrypted bytes
         password: Decryption password
+        key: Optional key from derive_key(password), to skip re-deriving it
     
     Returns:
         Decrypted string
@@ -67,12 +69,12 @@ def decrypt_content(encrypted_data: bytes, password: str) -> str:
     Raises:
         InvalidToken: If password is wrong or data is corrupted
     """
-    key = derive_key(password)
+    key = key or derive_key(password)
     fernet = Fernet(key)
     return fernet.decrypt(encrypted_data).decode('utf-8')
 
 
-def encrypt_file(filepath: str, password: str, output_path: str = None) -> str:
+def encrypt_file(filepath: str, password: str, output_path: str = None, key: bytes = None) -> str:
     """
     Encrypts a file and saves to .enc extension.
     
@@ -80,6 +82,7 @@ def encrypt_file(filepath: str, password: str, output_path: str = None) -> str:
         filepath: Path to plain text file
         password: Encryption password
         output_path: Optional output path (defaults to filepath + .enc)
+        key: Optional key from derive_key(password), to skip re-deriving it
     
     Returns:
         Path to encrypted file
@@ -87,7 +90,7 @@ def encrypt_file(filepath: str, password: str, output_path: str = None) -> str:
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    encrypted = encrypt_content(content, password)
+    encrypted = encrypt_content(content, password, key)
     
     if output_path is None:
         output_path = filepath + '.enc'
@@ -98,13 +101,14 @@ def encrypt_file(filepath: str, password: str, output_path: str = None) -> str:
     return output_path
 
 
-def decrypt_file(filepath: str, password: str) -> str:
+def decrypt_file(filepath: str, password: str, key: bytes = None) -> str:
     """
     Decrypts an encrypted file and returns content.
     
     Args:
         filepath: Path to encrypted file
         password: Decryption password
+        key: Optional key from derive_key(password), to skip re-deriving it
     
     Returns:
         Decrypted content string
@@ -112,7 +116,7 @@ def decrypt_file(filepath: str, password: str) -> str:
     with open(filepath, 'rb') as f:
         encrypted_data = f.read()
     
-    return decrypt_content(encrypted_data, password)
+    return decrypt_content(encrypted_data, password, key)
 
 
 class SecureKnowledgeBase:
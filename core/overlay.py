@@ -5,11 +5,13 @@ Features: Tactical radar, sharp industrial borders, WayneTech amber/steel color
 
 import sys
 import math
+import time
 import random
+from functools import lru_cache
 from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt, QTimer, QPointF, QRectF, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QPointF, QRectF, QLineF, pyqtSignal
 from PyQt6.QtGui import (QPainter, QColor, QPen, QBrush, QRadialGradient, QPolygonF, 
-                         QFont, QFontMetrics, QLinearGradient, QConicalGradient)
+                         QFont, QFontMetrics, QLinearGradient, QConicalGradient, QPixmap)
 
 # Import sounds module (optional - graceful fallback if not available)
 try:
@@ -33,6 +35,31 @@ except ImportError:
     WAVEFORM_INTERVAL = 100
     DIAGNOSTICS_INTERVAL = 5000
 
+# Colour transitions are precomputed ramps of this many frames
+COLOR_RAMP_STEPS = 24
+
+
+@lru_cache(maxsize=64)
+def _color_ramp(start_rgba, end_rgba, rate):
+    """
+    Eased colour transition from start to end as a tuple of QColors.
+    Follows the same curve as moving `rate` of the remaining distance each
+    frame, but is rescaled so the last frame lands exactly on the target.
+    """
+    total = 1 - (1 - rate) ** COLOR_RAMP_STEPS
+    ramp = []
+    for step in range(1, COLOR_RAMP_STEPS + 1):
+        f = (1 - (1 - rate) ** step) / total
+        ramp.append(QColor(*(round(a + (b - a) * f) for a, b in zip(start_rgba, end_rgba))))
+    return tuple(ramp)
+
+
+# When the radar is idle and its colour has settled, repaint every Nth tick
+IDLE_REPAINT_EVERY = 2
+
+# Typewriter repaint interval (ms); the text revealed is driven by elapsed time
+TYPEWRITER_TICK = 25
+
 # --- WAYNETECH COLOR PALETTE ---
 # Dark, tactical, industrial
 COLOR_BG_DARK = QColor(10, 12, 15, 230)      # Carbon Black / Dark Matte
@@ -549,6 +576,7 @@ class TechBubble(QWidget):
         self.displayed_text = ""
         self.opacity = 0.0
         self.target_opacity = 0.0
+        self._faded_out = True  # Blank frame already painted after a fade-out
         
         # Sizing Config
         self.MAX_WIDTH = 420
@@ -568,6 +596,7 @@ class TechBubble(QWidget):
             self.font = QFont("Courier New", 10)
         self.font.setBold(True)
         self.font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 0.5)
+        self.metrics = QFontMetrics(self.font)
         
         # Prefix configuration
         self.show_prefix = True
@@ -582,12 +611,14 @@ class TechBubble(QWidget):
         self.scan_line_y = 0.0
 
         # Typewriter Timer
-        self.typewriter_timer = QTimer()
+        self.typewriter_timer = QTimer(self)
         self.typewriter_timer.timeout.connect(self.update_typewriter)
         self.char_index = 0
+        self.char_speed = 30  # ms per character
+        self._typewriter_start = 0.0
         
         # Animation Timer
-        self.anim_timer = QTimer()
+        self.anim_timer = QTimer(self)
         self.anim_timer.timeout.connect(self.animate)
         self.anim_timer.start(ANIM_INTERVAL)  # Use config interval for CPU savings
         
@@ -597,6 +628,19 @@ class TechBubble(QWidget):
         
         self.border_color = COLOR_BORDER
         self.target_border_color = COLOR_BORDER
+        self._border_ramp = None  # Active colour transition (tuple of QColors)
+        self._border_ramp_index = 0
+        
+        # Painting resources reused across frames. Pens that follow the border
+        # colour are rebuilt only when it changes; size-dependent geometry only
+        # when the bubble is resized.
+        self._bg_brush = QBrush(COLOR_BG_DARK)
+        self._grid_pen = QPen(QColor(255, 255, 255, 10))
+        self._grid_pen.setWidth(1)
+        self._scan_pen = QPen(QColor(255, 255, 255, 15))
+        self._scan_pen.setWidth(2)
+        self._update_border_pens()
+        self._geometry_size = None
         
         # Waveform visualizer (positioned at bottom of bubble)
         self.waveform = WaveformVisualizer(self)
@@ -610,6 +654,8 @@ class TechBubble(QWidget):
         
     def set_border_color(self, color):
         self.target_border_color = color
+        self._border_ramp = _color_ramp(self.border_color.getRgb(), color.getRgb(), 0.15)
+        self._border_ramp_index = 0
         self.waveform.set_color(color)
     
     def set_speaking(self, speaking):
@@ -650,25 +696,65 @@ class TechBubble(QWidget):
     def animate(self):
         self.scan_line_y = (self.scan_line_y + 2) % self.height()
         
-        # Smooth opacity
+        # Smooth opacity (snapped once within 0.5%, so the settled state is exact)
         self.opacity += (self.target_opacity - self.opacity) * 0.2
+        if abs(self.target_opacity - self.opacity) < 0.005:
+            self.opacity = self.target_opacity
         
         # Smooth color
-        if self.border_color != self.target_border_color:
-            self.border_color = self._lerp_color(self.border_color, self.target_border_color, 0.15)
+        if self._border_ramp:
+            self.border_color = self._border_ramp[self._border_ramp_index]
+            self._border_ramp_index += 1
+            if self._border_ramp_index == len(self._border_ramp):
+                self._border_ramp = None
+            self._update_border_pens()
         
         # Update particles
         self._update_particles()
         
+        # Fully faded out: paintEvent draws nothing, so repaint once to clear
+        # the last faint frame and then stop
+        if self.target_opacity == 0 and self.opacity < 0.05:
+            if not self._faded_out:
+                self._faded_out = True
+                self.update()
+            return
+        
+        self._faded_out = False
         self.update()
+
+    def showEvent(self, event):
+        self.anim_timer.start(ANIM_INTERVAL)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Stop animating while hidden (minimized or during boot)
+        self.anim_timer.stop()
+        super().hideEvent(event)
     
-    def _lerp_color(self, c1, c2, t):
-        return QColor(
-            int(c1.red() + (c2.red() - c1.red()) * t),
-            int(c1.green() + (c2.green() - c1.green()) * t),
-            int(c1.blue() + (c2.blue() - c1.blue()) * t),
-            int(c1.alpha() + (c2.alpha() - c1.alpha()) * t)
-        )
+    def _update_border_pens(self):
+        """Rebuild the pens that use the current border colour."""
+        self._border_pen = QPen(self.border_color)
+        self._border_pen.setWidth(1)
+        self._corner_pen = QPen(self.border_color)
+        self._corner_pen.setWidth(3)
+
+    def _update_geometry(self, w, h):
+        """Precompute grid and corner-bracket lines for the current size."""
+        self._grid_lines = [QLineF(i, 0, i, h) for i in range(0, w, 20)]
+        
+        corner_len = 15
+        self._corner_lines = [
+            # Top Left
+            QLineF(0, 0, corner_len, 0), QLineF(0, 0, 0, corner_len),
+            # Top Right
+            QLineF(w, 0, w - corner_len, 0), QLineF(w, 0, w, corner_len),
+            # Bottom Left
+            QLineF(0, h, corner_len, h), QLineF(0, h, 0, h - corner_len),
+            # Bottom Right
+            QLineF(w, h, w - corner_len, h), QLineF(w, h, w, h - corner_len),
+        ]
+        self._geometry_size = (w, h)
 
     def set_text(self, text):
         if not text:
@@ -682,32 +768,35 @@ class TechBubble(QWidget):
             self.scroll_y = 0
             
             # Sizing logic
-            metrics = QFontMetrics(self.font)
             text_width = self.MAX_WIDTH - (self.PADDING * 2)
-            rect = metrics.boundingRect(0, 0, text_width, 0, Qt.TextFlag.TextWordWrap, text)
+            rect = self.metrics.boundingRect(0, 0, text_width, 0, Qt.TextFlag.TextWordWrap, text)
             required_height = rect.height() + (self.PADDING * 2) + 10
             new_height = max(self.MIN_HEIGHT, min(required_height, self.MAX_HEIGHT))
             self.setFixedHeight(new_height)
             
-            speed = max(5, min(30, 1000 // max(len(text), 1)))
-            self.typewriter_timer.start(speed)
+            # Reveal pace (ms per character) is unchanged, but repaints run at
+            # a fixed tick and reveal however many characters are due by then
+            self.char_speed = max(5, min(30, 1000 // max(len(text), 1)))
+            self._typewriter_start = time.monotonic()
+            self.typewriter_timer.start(TYPEWRITER_TICK)
             
         self.update()
 
     def update_typewriter(self):
         if self.char_index < len(self.full_text):
-            self.displayed_text += self.full_text[self.char_index]
-            self.char_index += 1
+            elapsed_ms = (time.monotonic() - self._typewriter_start) * 1000
+            self.char_index = min(int(elapsed_ms // self.char_speed), len(self.full_text))
+            self.displayed_text = self.full_text[:self.char_index]
             
             # Auto-scroll
-            metrics = QFontMetrics(self.font)
             text_width = self.width() - (self.PADDING * 2)
-            current_rect = metrics.boundingRect(0, 0, text_width, 0, Qt.TextFlag.TextWordWrap, self.displayed_text)
+            current_rect = self.metrics.boundingRect(0, 0, text_width, 0, Qt.TextFlag.TextWordWrap, self.displayed_text)
             
             if current_rect.height() > (self.height() - self.PADDING * 2):
                 self.scroll_y = current_rect.height() - (self.height() - self.PADDING * 2)
-                
-            self.update()
+            
+            # Only the text area changed
+            self.update(self.PADDING, self.PADDING, self.width() - 2 * self.PADDING, self.height() - 2 * self.PADDING)
         else:
             self.typewriter_timer.stop()
             
@@ -717,22 +806,28 @@ class TechBubble(QWidget):
 
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setOpacity(self.opacity)
+        fully_visible = self.opacity == 1.0
+        if not fully_visible:
+            painter.setOpacity(self.opacity)
         
         w, h = self.width(), self.height()
+        if self._geometry_size != (w, h):
+            self._update_geometry(w, h)
         
         # --- BACKGROUND (Carbon Fiber / Matte Mesh feel) ---
-        bg_brush = QBrush(COLOR_BG_DARK)
-        painter.setBrush(bg_brush)
+        # The window background is transparent, so at full opacity the fill
+        # can be copied straight in rather than blended
+        if fully_visible:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.setBrush(self._bg_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(0, 0, w, h, self.BORDER_RADIUS, self.BORDER_RADIUS)
+        if fully_visible:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
         
         # --- GRID OVERLAY (SUBTLE) ---
-        grid_pen = QPen(QColor(255, 255, 255, 10))
-        grid_pen.setWidth(1)
-        painter.setPen(grid_pen)
-        for i in range(0, w, 20):
-            painter.drawLine(i, 0, i, h)
+        painter.setPen(self._grid_pen)
+        painter.drawLines(self._grid_lines)
         
         # --- FLOATING PARTICLES ---
         painter.setPen(Qt.PenStyle.NoPen)
@@ -743,30 +838,13 @@ class TechBubble(QWidget):
             painter.drawEllipse(QPointF(p['x'], p['y']), p['size'], p['size'])
         
         # --- BORDER & CORNER ACCENTS ---
-        border_pen = QPen(self.border_color)
-        border_pen.setWidth(1)
-        painter.setPen(border_pen)
+        painter.setPen(self._border_pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawRoundedRect(1, 1, w-2, h-2, self.BORDER_RADIUS, self.BORDER_RADIUS)
         
         # Thick corners (Tactical brackets)
-        corner_len = 15
-        thick_pen = QPen(self.border_color)
-        thick_pen.setWidth(3)
-        painter.setPen(thick_pen)
-        
-        # Top Left
-        painter.drawLine(0, 0, corner_len, 0)
-        painter.drawLine(0, 0, 0, corner_len)
-        # Top Right
-        painter.drawLine(w, 0, w-corner_len, 0)
-        painter.drawLine(w, 0, w, corner_len)
-        # Bottom Left
-        painter.drawLine(0, h, corner_len, h)
-        painter.drawLine(0, h, 0, h-corner_len)
-        # Bottom Right
-        painter.drawLine(w, h, w-corner_len, h)
-        painter.drawLine(w, h, w, h-corner_len)
+        painter.setPen(self._corner_pen)
+        painter.drawLines(self._corner_lines)
 
         # --- TEXT ---
         text_y_offset = self.PADDING
@@ -789,9 +867,7 @@ class TechBubble(QWidget):
         
         # --- SCAN LINE (Subtle vertical scan) ---
         painter.setClipping(False)
-        scan_pen = QPen(QColor(255, 255, 255, 15))
-        scan_pen.setWidth(2)
-        painter.setPen(scan_pen)
+        painter.setPen(self._scan_pen)
         painter.drawLine(0, int(self.scan_line_y), w, int(self.scan_line_y))
 
 
@@ -814,19 +890,30 @@ class WayneSystemStatus(QWidget):
         
         self.current_color = COLOR_SYSTEM_OK
         self.target_color = COLOR_SYSTEM_OK
+        self._color_ramp = None  # Active colour transition (tuple of QColors)
+        self._ramp_index = 0
         
         # Breathing animation
         self.breathing_phase = 0.0
         self.breathing_intensity = 0.0  # Current intensity (for smooth transitions)
         
+        # Single-shot frame timer: each paint schedules the next frame for
+        # ANIM_INTERVAL after it started, so slow paints don't pile up ticks
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.animate)
         self.timer.start(ANIM_INTERVAL)  # Use config interval for CPU savings
         
         self.blips = [] # Random radar blips
+        self._idle_tick = 0  # Frame counter for the reduced idle repaint rate
+        self._ring_rect = QRectF(-68, -68, 136, 136)  # Outer ring bounds (painter is centred)
+        self._grid_pixmap = None  # Static radar grid, redrawn only when the colour changes
+        self._grid_rgba = None
         
     def set_color(self, color):
         self.target_color = color
+        self._color_ramp = _color_ramp(self.current_color.getRgb(), color.getRgb(), 0.1)
+        self._ramp_index = 0
         
     def set_active(self, active):
         self.active = active
@@ -863,33 +950,55 @@ class WayneSystemStatus(QWidget):
         self.breathing_intensity += (target_intensity - self.breathing_intensity) * 0.1
             
         # Color Interp
-        if self.current_color != self.target_color:
-            self.current_color = self._lerp_color(self.current_color, self.target_color, 0.1)
+        if self._color_ramp:
+            self.current_color = self._color_ramp[self._ramp_index]
+            self._ramp_index += 1
+            if self._ramp_index == len(self._color_ramp):
+                self._color_ramp = None
 
         # Random blips management
         if random.random() < 0.05 and self.active:
-            self.blips.append({'r': random.randint(10, 50), 'a': random.randint(0, 360), 'life': 1.0})
+            # Position is fixed for the blip's lifetime, so resolve it once here
+            r = random.randint(10, 50)
+            a = math.radians(random.randint(0, 360))
+            self.blips.append({'pos': QPointF(75 + r * math.cos(a), 75 + r * math.sin(a)), 'life': 1.0})
         
         for blip in self.blips:
             blip['life'] -= 0.02
         self.blips = [b for b in self.blips if b['life'] > 0]
+        
+        # Idle with a settled colour only the slow sweep and breathing move,
+        # so repaint at a reduced rate
+        # The next frame is normally scheduled by paintEvent; this start is
+        # the fallback for skipped frames or paints Qt never delivers
+        self.timer.start(ANIM_INTERVAL)
+        if not self.active and not self.blips and not self._color_ramp:
+            self._idle_tick = (self._idle_tick + 1) % IDLE_REPAINT_EVERY
+            if self._idle_tick:
+                return
             
         self.update()
 
-    def _lerp_color(self, c1, c2, t):
-        return QColor(
-            int(c1.red() + (c2.red() - c1.red()) * t),
-            int(c1.green() + (c2.green() - c1.green()) * t),
-            int(c1.blue() + (c2.blue() - c1.blue()) * t)
-        )
+    def showEvent(self, event):
+        self.timer.start(ANIM_INTERVAL)
+        super().showEvent(event)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def hideEvent(self, event):
+        # Nothing to draw while hidden
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def _render_grid(self):
+        """Draw the static radar grid (rings + crosshairs) into an offscreen pixmap."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
         cx, cy = 75, 75
         
-        # --- BASE RADAR GRID ---
         grid_color = QColor(self.current_color)
         grid_color.setAlpha(80)
         grid_pen = QPen(grid_color)
@@ -905,6 +1014,22 @@ class WayneSystemStatus(QWidget):
         # Crosshairs
         painter.drawLine(cx - 65, cy, cx + 65, cy)
         painter.drawLine(cx, cy - 65, cx, cy + 65)
+        painter.end()
+        
+        self._grid_pixmap = pixmap
+        self._grid_rgba = self.current_color.rgba()
+
+    def paintEvent(self, event):
+        paint_start = time.perf_counter()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        cx, cy = 75, 75
+        
+        # --- BASE RADAR GRID ---
+        if self._grid_pixmap is None or self._grid_rgba != self.current_color.rgba():
+            self._render_grid()
+        painter.drawPixmap(0, 0, self._grid_pixmap)
         
         # --- RADAR SWEEP ---
         scan_grad = QConicalGradient(cx, cy, -self.sweep_angle)
@@ -921,14 +1046,11 @@ class WayneSystemStatus(QWidget):
         for blip in self.blips:
             # Draw blip if sweep just passed it? 
             # Simplified: just draw fading blips
-            bx = cx + blip['r'] * math.cos(math.radians(blip['a']))
-            by = cy + blip['r'] * math.sin(math.radians(blip['a']))
-            
             blip_color = QColor(self.current_color)
             blip_color.setAlphaF(blip['life'])
             
             painter.setBrush(QBrush(blip_color))
-            painter.drawEllipse(QPointF(bx, by), 3, 3)
+            painter.drawEllipse(blip['pos'], 3, 3)
 
         # --- OUTER RING (Rotates slowly opposite) ---
         painter.save()
@@ -941,7 +1063,7 @@ class WayneSystemStatus(QWidget):
         
         # Draw segmented ring
         for i in range(0, 360, 45):
-            painter.drawArc(QRectF(-68, -68, 136, 136), i * 16, 30 * 16)
+            painter.drawArc(self._ring_rect, i * 16, 30 * 16)
             
         painter.restore()
         
@@ -962,6 +1084,12 @@ class WayneSystemStatus(QWidget):
                     painter.setBrush(Qt.BrushStyle.NoBrush)
                     radius = 65 + ring * 4 + glow_strength * 3
                     painter.drawEllipse(QPointF(cx, cy), radius, radius)
+        
+        painter.end()
+        # Next frame: the remainder of the frame budget after this paint
+        if self.isVisible():
+            elapsed_ms = int((time.perf_counter() - paint_start) * 1000)
+            self.timer.start(max(0, ANIM_INTERVAL - elapsed_ms))
 
 
 class OverlayWindow(QWidget):
@@ -1213,6 +1341,11 @@ class OverlayWindow(QWidget):
         self.radar.set_color(color)
         self.bubble.set_border_color(color)
     
+    def show_response(self, text, color):
+        """Show text and set the sentiment colour in one update."""
+        self.set_text(text)
+        self.set_sentiment_color(color)
+    
     def set_speaking(self, speaking):
         """Enable/disable waveform animation for speech visualization."""
         self.bubble.set_speaking(speaking)
@@ -3,31 +3,58 @@ UI Sound Effects for ALFRED - WayneTech Edition.
 Provides subtle audio feedback for interactions.
 """
 
+import queue
 import threading
+import time
+
+try:
+    import winsound
+    WINSOUND_AVAILABLE = True
+except ImportError:
+    # winsound not available (non-Windows)
+    WINSOUND_AVAILABLE = False
 
 # Sound enabled flag (can be toggled)
 SOUNDS_ENABLED = True
 
+# Tones are played in order by a single background worker.
+# Items are (frequency, duration_ms) or ('sleep', duration_ms).
+_tone_queue = queue.Queue()
+_tone_worker = None
+_worker_lock = threading.Lock()
+
+
+def _tone_loop():
+    """Worker loop: play queued tones and pauses one after another."""
+    while True:
+        frequency, duration_ms = _tone_queue.get()
+        try:
+            if frequency == 'sleep':
+                time.sleep(duration_ms / 1000)
+            else:
+                winsound.Beep(frequency, duration_ms)
+        except Exception:
+            pass
 
-def _play_tone(frequency, duration_ms):
-    """Play a simple tone using winsound (Windows only)."""
-    if not SOUNDS_ENABLED:
+
+def _enqueue(*items):
+    """Queue tones for the worker, starting it on first use."""
+    global _tone_worker
+    if not SOUNDS_ENABLED or not WINSOUND_AVAILABLE:
         return
     
-    try:
-        import winsound
-        # Run in thread to avoid blocking
-        def play():
-            try:
-                winsound.Beep(frequency, duration_ms)
-            except Exception:
-                pass
-        
-        thread = threading.Thread(target=play, daemon=True)
-        thread.start()
-    except ImportError:
-        # winsound not available (non-Windows)
-        pass
+    with _worker_lock:
+        if _tone_worker is None:
+            _tone_worker = threading.Thread(target=_tone_loop, daemon=True, name="ToneWorker")
+            _tone_worker.start()
+    
+    for item in items:
+        _tone_queue.put(item)
+
+
+def _play_tone(frequency, duration_ms):
+    """Play a simple tone using winsound (Windows only) without blocking."""
+    _enqueue((frequency, duration_ms))
 
 
 def play_click():
@@ -47,26 +74,12 @@ def play_boot_beep():
 
 def play_success():
     """Play success/confirmation tone."""
-    def play():
-        import time
-        _play_tone(800, 80)
-        time.sleep(0.1)
-        _play_tone(1000, 80)
-    
-    thread = threading.Thread(target=play, daemon=True)
-    thread.start()
+    _enqueue((800, 80), ('sleep', 100), (1000, 80))
 
 
 def play_alert():
     """Play alert/warning tone."""
-    def play():
-        import time
-        _play_tone(400, 150)
-        time.sleep(0.1)
-        _play_tone(400, 150)
-    
-    thread = threading.Thread(target=play, daemon=True)
-    thread.start()
+    _enqueue((400, 150), ('sleep', 100), (400, 150))
 
 
 def set_sounds_enabled(enabled):
@@ -76,7 +89,6 @@ def set_sounds_enabled(enabled):
 
 
 if __name__ == "__main__":
-    import time
     print("Testing ALFRED UI sounds...")
     
     print("Click...")
@@ -1,20 +1,87 @@
 import subprocess
-import psutil # pip install psutil
 import webbrowser
-import pyautogui # pip install pyautogui
 import datetime
-import requests
 import os
-import pyperclip # pip install pyperclip
+import re
+import shutil
 import time
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
 from langchain_core.tools import tool
-from core.app_launcher import AppLauncher
 
-# Initialize Dynamic Launcher
-launcher = AppLauncher()
+# --- LAZY IMPORTS ---
+# Heavy modules are imported on first use by the tools that need them,
+# so importing this module (and booting ALFRED) stays fast.
+
+@lru_cache(maxsize=1)
+def _psutil():
+    import psutil # pip install psutil
+    return psutil
+
+@lru_cache(maxsize=1)
+def _pyautogui():
+    import pyautogui # pip install pyautogui
+    return pyautogui
+
+@lru_cache(maxsize=1)
+def _pyperclip():
+    import pyperclip # pip install pyperclip
+    return pyperclip
+
+@lru_cache(maxsize=1)
+def _requests():
+    import requests
+    return requests
+
+@lru_cache(maxsize=1)
+def _launcher():
+    # Initialize Dynamic Launcher (scans the Start Menu once)
+    from core.app_launcher import AppLauncher
+    return AppLauncher()
 
 # --- TOOL 1: OPEN APPLICATIONS ---
 
+# Hardcoded fallback (system apps / special commands), built once at import.
+# Keys are lowercase; read-only so no caller can widen the allowlist.
+_APP_MAP = MappingProxyType({
+    # Windows App Mappings
+    "notepad": "notepad.exe",
+    "calculator": "calc.exe",
+    "chrome": "chrome.exe",
+    "vscode": "code",
+    "spotify": "spotify",
+    "terminal": "cmd.exe", # or powershell.exe
+    "explorer": "explorer",
+    "edge": "msedge.exe",
+    "brave": "brave.exe",
+
+    # Additional Windows Apps
+    "firefox": "firefox.exe",
+    "files": "explorer",
+    "settings": "ms-settings:",
+    "word": "winword.exe",
+    "excel": "excel.exe",
+    "powerpoint": "powerpnt.exe",
+    "discord": os.path.expandvars(r"%AppData%\Microsoft\Windows\Start Menu\Programs\Discord Inc\Discord PTB.lnk"),
+    "vlc": "vlc.exe",
+    "steam": "steam.exe",
+    "control panel": "control",
+    "task manager": "taskmgr",
+})
+
+# Names open_application may launch outside the Start Menu index
+_ALLOWED_APPS = frozenset(_APP_MAP)
+
+# Shell metacharacters and line breaks: never part of a real app name
+_UNSAFE_APP_CHARS = re.compile(r'[;&|`$<>\n\r\\]')
+
+@lru_cache(maxsize=None)
+def _which(command):
+    """Absolute path of an allowlisted command on PATH (looked up once), or None."""
+    return shutil.which(command)
+
 @tool
 def open_application(app_name: str):
     """
@@ -22,8 +89,13 @@ def open_application(app_name: str):
     Input 'app_name' should be the simple name of the app (e.g., 'calculator', 'notepad').
     Do not reply with text; use this tool.
     """
+    # 0. Reject command-injection attempts before any lookup
+    if _UNSAFE_APP_CHARS.search(app_name):
+        return (f"Error: '{app_name}' is not in the allowed applications list "
+                "(safety restriction: unsafe characters).")
+    
     # 1. Dynamic Lookup (Start Menu)
-    path = launcher.get_app_path(app_name)
+    path = _launcher().get_app_path(app_name)
     if path:
         try:
             print(f"Launching via Shortcut: {path}")
@@ -33,40 +105,12 @@ def open_application(app_name: str):
             return f"Found {app_name}, but failed to launch: {e}"
 
     # 2. Hardcoded Fallback (System Apps / Special Commands)
-    app_map = {
-        # Windows App Mappings
-        "notepad": "notepad.exe",
-        "calculator": "calc.exe",
-        "chrome": "chrome.exe",
-        "vscode": "code",
-        "spotify": "spotify",
-        "terminal": "cmd.exe", # or powershell.exe
-        "explorer": "explorer",
-        "edge": "msedge.exe",
-        "brave": "brave.exe",
-        
-        # Additional Windows Apps
-        "firefox": "firefox.exe",
-        "files": "explorer",
-        "settings": "ms-settings:",
-        "word": "winword.exe",
-        "excel": "excel.exe",
-        "powerpoint": "powerpnt.exe",
-        "discord": os.path.expandvars(r"%AppData%\Microsoft\Windows\Start Menu\Programs\Discord Inc\Discord PTB.lnk"),
-        "vlc": "vlc.exe",
-        "steam": "steam.exe",
-        "control panel": "control",
-        "task manager": "taskmgr",
-    }
- 
-    # Normalize input
-    key = app_name.lower()
-    
     # STRICT LOOKUP: Only allow apps defined in the map
-    if key not in app_map:
-        return f"Error: '{app_name}' not found in installed apps or system map."
-    
-    target = app_map[key]
+    key = app_name.lower()
+    if key not in _ALLOWED_APPS:
+        return (f"Error: '{app_name}' is not in the allowed applications list "
+                "(safety restriction). It was not found among installed apps either.")
+    target = _APP_MAP[key]
     
     try:
         # Windows specific handling
@@ -74,11 +118,15 @@ def open_application(app_name: str):
             os.startfile(target)
             return f"Successfully launched {app_name}."
             
-        # Try launching using subprocess
-        # On Windows, shell=True can be useful for finding commands in PATH if not direct executables,
-        # but Popen with list is generally safer.
-        # However, for things like 'explorer', it works better with Popen.
-        subprocess.Popen(target, shell=True)
+        # Launch the executable directly: no cmd.exe in between, and no shell parsing
+        executable = _which(target)
+        if executable is not None:
+            subprocess.Popen([executable])
+        elif hasattr(os, "startfile"):
+            # Not on PATH: shortcuts and App Paths registrations (chrome.exe, winword.exe)
+            os.startfile(target)
+        else:
+            raise FileNotFoundError(target)
         return f"Successfully launched {app_name}."
 
     except FileNotFoundError:
@@ -87,10 +135,32 @@ def open_application(app_name: str):
         return f"Failed to launch {app_name}: {e}"
 
 # --- TOOL 2: SYSTEM HEALTH ---
+
+CPU_SAMPLE_INTERVAL = 1.0  # seconds per background CPU measurement
+
+# Latest CPU percentage from the background sampler (None until the first sample)
+_CPU_STATE = {'cpu': None}
+
+def _cpu_sampler():
+    """Measure CPU usage over CPU_SAMPLE_INTERVAL, forever."""
+    psutil = _psutil()
+    while True:
+        _CPU_STATE['cpu'] = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+
+@lru_cache(maxsize=1)
+def _start_cpu_sampler():
+    # Started on the first status request, so importing this module spawns nothing
+    threading.Thread(target=_cpu_sampler, daemon=True, name="CPUSampler").start()
+
 @tool
 def get_system_status():
     """Returns the current CPU usage percent and RAM usage percent."""
-    cpu = psutil.cpu_percent(interval=0.1)
+    psutil = _psutil()
+    _start_cpu_sampler()
+    cpu = _CPU_STATE['cpu']
+    if cpu is None:
+        # First request, before the sampler has a reading: measure once directly
+        cpu = psutil.cpu_percent(interval=0.1)
     memory = psutil.virtual_memory()
     return f"CPU Usage: {cpu}%\nRAM Usage: {memory.percent}% ({memory.used // (1024**3)}GB used)"
 
@@ -107,25 +177,28 @@ def google_search(query: str):
     return f"I have opened a Google search for: {query}"
 
 # --- TOOL 4: VOLUME CONTROL ---
+
+# action -> (keys to press, confirmation)
+_VOL_KEYS = {
+    "up": (["volumeup", "volumeup"], "Volume turned up."),
+    "down": (["volumedown", "volumedown"], "Volume turned down."),
+    "mute": (["volumemute"], "Volume muted."),
+}
+
 @tool
 def system_volume(action: str):
     """
     Controls system volume. Input 'action' must be 'up', 'down', or 'mute'.
     Use this when the user asks to increase/decrease volume or mute the system.
     """
-    if action == "up":
-        pyautogui.press("volumeup")
-        pyautogui.press("volumeup")
-        return "Volume turned up."
-    elif action == "down":
-        pyautogui.press("volumedown")
-        pyautogui.press("volumedown")
-        return "Volume turned down."
-    elif action == "mute":
-        pyautogui.press("volumemute")
-        return "Volume muted."
-    else:
+    entry = _VOL_KEYS.get(action)
+    if entry is None:
         return f"Unknown volume action: {action}. Use 'up', 'down', or 'mute'."
+    
+    keys, message = entry
+    # All keys in one call, without pyautogui's 0.1 s post-action PAUSE
+    _pyautogui().press(keys, _pause=False)
+    return message
 
 # --- TOOL 5: MEDIA PLAY/PAUSE ---
 @tool
@@ -134,7 +207,7 @@ def media_play_pause():
     Toggles play/pause for any media player (Spotify, YouTube, VLC, etc.).
     Use this when the user asks to 'play', 'pause', 'resume', or 'stop' media.
     """
-    pyautogui.press("playpause")
+    _pyautogui().press("playpause", _pause=False)
     return "Media play/pause toggled."
 
 # --- TOOL 6: MEDIA NEXT TRACK ---
@@ -144,7 +217,7 @@ def media_next():
     Skips to the next track or video in any media player.
     Use this when the user asks to 'skip', 'next song', 'next track', or 'next video'.
     """
-    pyautogui.press("nexttrack")
+    _pyautogui().press("nexttrack", _pause=False)
     return "Skipped to next track."
 
 # --- TOOL 7: MEDIA PREVIOUS TRACK ---
@@ -154,10 +227,73 @@ def media_previous():
     Goes back to the previous track or video in any media player.
     Use this when the user asks to 'previous song', 'go back', or 'last track'.
     """
-    pyautogui.press("prevtrack")
+    _pyautogui().press("prevtrack", _pause=False)
     return "Went back to previous track."
 
 # --- TOOL 8: SEARCH KNOWLEDGE BASE ---
+
+_BRAIN_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "brain.txt")
+
+# Decoded knowledge base as its non-blank lines, alongside a lowercased copy.
+# Rebuilt only when the source file (encrypted or plain) changes on disk.
+_KB_CACHE = {'path': None, 'mtime_ns': 0, 'lines': [], 'lower': []}
+
+def _load_knowledge_base(brain_file):
+    """Return (lines, lowercased lines) for the knowledge base, using the cache when fresh."""
+    encrypted_file = brain_file + '.enc'
+    source = encrypted_file if os.path.exists(encrypted_file) else brain_file
+    mtime_ns = os.stat(source).st_mtime_ns
+    
+    if _KB_CACHE['path'] == source and _KB_CACHE['mtime_ns'] == mtime_ns:
+        return _KB_CACHE['lines'], _KB_CACHE['lower']
+    
+    try:
+        # Handles both encrypted and plain text
+        from core.encryption import SecureKnowledgeBase
+        content = SecureKnowledgeBase(brain_file).load()
+    except ImportError:
+        # Encryption module not available - plain text only
+        with open(brain_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+    
+    # Blank lines never match a query, so drop them here rather than per search
+    lines = [line for line in content.splitlines() if line.strip()]
+    lower_lines = [line.lower() for line in lines]
+    
+    # Don't cache a failed decrypt (e.g. missing password); retry next call
+    if content:
+        _KB_CACHE.update(path=source, mtime_ns=mtime_ns, lines=lines, lower=lower_lines)
+    
+    return lines, lower_lines
+
+# The lowercased lines joined into one string, with each line's start offset,
+# so a query is one C-level str.find scan over the whole knowledge base
+_KB_INDEX = {'lower': None, 'text': '', 'starts': []}
+
+def _match_lines(lines, lower_lines, query_lower):
+    """Return the lines whose lowercased form contains query_lower, in file order."""
+    if not query_lower or '\n' in query_lower:
+        # Degenerate queries: keep the per-line semantics (no cross-line matches)
+        return [line for line, lower in zip(lines, lower_lines) if query_lower in lower]
+    
+    if _KB_INDEX['lower'] is not lower_lines:
+        starts, offset = [], 0
+        for lower in lower_lines:
+            starts.append(offset)
+            offset += len(lower) + 1
+        _KB_INDEX.update(lower=lower_lines, text='\n'.join(lower_lines), starts=starts)
+    
+    text, starts = _KB_INDEX['text'], _KB_INDEX['starts']
+    matches = []
+    hit = text.find(query_lower)
+    while hit != -1:
+        i = bisect_right(starts, hit) - 1
+        matches.append(lines[i])
+        if i + 1 == len(starts):
+            break
+        hit = text.find(query_lower, starts[i + 1])  # one result per line
+    return matches
+
 @tool
 def search_knowledge_base(query: str):
     """
@@ -168,45 +304,19 @@ def search_knowledge_base(query: str):
     Supports both encrypted (.enc) and plain text formats.
     """
     try:
-        from core.encryption import SecureKnowledgeBase
-        
-        brain_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "brain.txt")
-        
-        # Initialize secure knowledge base (handles both encrypted and plain)
-        kb = SecureKnowledgeBase(brain_file)
-        matching_lines = kb.search(query)
-        
-        if matching_lines:
-            return "From your knowledge base:\n" + "\n".join(matching_lines)
-        else:
-            return f"No information found in knowledge base for: {query}"
-            
-    except (ImportError, RuntimeError):
-        # Fallback to plain text search if:
-        # - encryption module not available (ImportError)
-        # - running in non-interactive mode without password (RuntimeError)
-        try:
-            brain_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "brain.txt")
-            
-            if not os.path.exists(brain_file):
-                return "Knowledge base not found. Please create a brain.txt file with your personal information."
-            
-            with open(brain_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            query_lower = query.lower()
-            lines = content.split('\n')
-            matching_lines = [line for line in lines if query_lower in line.lower() and line.strip()]
-            
-            if matching_lines:
-                return "From your knowledge base:\n" + "\n".join(matching_lines)
-            else:
-                return f"No information found in knowledge base for: {query}"
-                
-        except Exception as e:
-            return f"Error accessing knowledge base: {e}"
+        lines, lower_lines = _load_knowledge_base(_BRAIN_FILE)
+    except FileNotFoundError:
+        return "Knowledge base not found. Please create a brain.txt file with your personal information."
     except Exception as e:
         return f"Error accessing knowledge base: {e}"
+    
+    query_lower = query.lower()
+    matching_lines = _match_lines(lines, lower_lines, query_lower)
+    
+    if matching_lines:
+        return "From your knowledge base:\n" + "\n".join(matching_lines)
+    else:
+        return f"No information found in knowledge base for: {query}"
 
 # --- TOOL 9: DATE & TIME ---
 @tool
@@ -239,7 +349,7 @@ def get_weather(city: str):
     }
     
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = _requests().get(base_url, params=params, timeout=10)
         data = response.json()
         
         if data["cod"] != 200:
@@ -265,7 +375,7 @@ def write_to_screen(text: str):
     # 1. Copy text to clipboard (Safety & Speed)
     # Typing long code char-by-char often breaks indentation in editors like VS Code/LeetCode.
     # Pasting is instant and preserves formatting.
-    pyperclip.copy(text)
+    _pyperclip().copy(text)
     
     # 2. Safety Delay (Give user time to focus the box)
     # We don't want to paste immediately in case focus is wrong.
@@ -273,6 +383,15 @@ def write_to_screen(text: str):
     
     # 3. Simulate Paste (Ctrl+V)
     # pyautogui detects OS automatically usually, but standard is ctrl+v
-    pyautogui.hotkey('ctrl', 'v')
+    _pyautogui().hotkey('ctrl', 'v')
     
-    return "Text pasted successfully."
\ No newline at end of file
+    return "Text pasted successfully."
+
+# --- REGISTRY ---
+
+# Every tool, built once here (the @tool schemas are generated at import),
+# plus a name -> tool lookup for dispatching the model's tool calls
+TOOLS = (open_application, get_system_status, google_search, system_volume,
+         media_play_pause, media_next, media_previous, search_knowledge_base,
+         get_current_time, get_weather, write_to_screen)
+TOOL_MAP = MappingProxyType({t.name: t for t in TOOLS})
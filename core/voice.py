@@ -1,8 +1,10 @@
 import asyncio
+import io
 import os
-import sys
+import queue
 import time
 import re
+import threading
 import pygame
 import edge_tts
 import keyboard
@@ -10,6 +12,11 @@ from colorama import Fore
 
 import config
 
+# Markdown characters dropped before speaking (bold/italic, headings, links, code)
+_SPEECH_STRIP_TABLE = str.maketrans('', '', '*#_[]`')
+_PARENS_RE = re.compile(r'\([^)]*\)')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class AlfredVoice:
     """
     Handles Text-to-Speech (TTS) using Microsoft Edge TTS and Pygame.
@@ -19,39 +26,85 @@ class AlfredVoice:
         try:
             pygame.mixer.init()
             self.voice_name = config.VOICE_NAME
-            self.temp_file = "temp_speech.mp3"
+            # Speech gets its own reserved channel, so other sounds never steal it
+            pygame.mixer.set_reserved(1)
+            self._channel = pygame.mixer.Channel(0)
         except Exception as e:
             print(Fore.RED + f"Voice Init Error: {e}")
-
-    def clean_text_for_speech(self, text):
-        """Remove markdown and special characters that shouldn't be spoken."""
-        # Remove asterisks (bold/italic markdown)
-        text = text.replace('*', '')
         
-        # Remove hashtags
-        text = text.replace('#', '')
+        # ESC/ENTER interrupt speech. The hotkeys are registered once and set
+        # an event, so playback can block on it instead of polling the keyboard.
+        self._stop_event = threading.Event()
+        try:
+            keyboard.add_hotkey('esc', self._interrupt)
+            keyboard.add_hotkey('enter', self._interrupt)
+        except Exception as e:
+            print(Fore.YELLOW + f"⚠ Speech interrupt hotkeys unavailable: {e}")
         
-        # Remove underscores
-        text = text.replace('_', '')
+        # One long-lived event loop for edge-tts, instead of building and
+        # tearing down a new loop with asyncio.run() for every utterance
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True, name="TTSLoop").start()
         
-        # Remove brackets
-        text = text.replace('[', '').replace(']', '')
+        # Sentence pipeline (see say()): one thread synthesizes the next
+        # sentence while another plays the current one. Items are tagged with
+        # the reply they belong to (see begin_reply()), so an interrupt can
+        # discard the rest of that reply, including sentences not yet streamed.
+        self._text_queue = queue.Queue()
+        self._audio_queue = queue.Queue()
+        self._reply = 0
+        self._reply_interrupted = False
+        self._reply_lock = threading.Lock()  # guards _reply and _reply_interrupted
+        self._pipeline_lock = threading.Lock()
+        self._pipeline_started = False
+
+    def _interrupt(self):
+        """Hotkey callback: request that current playback stops."""
+        self._stop_event.set()
+
+    def clean_text_for_speech(self, text):
+        """Remove markdown and special characters that shouldn't be spoken."""
+        # Strip markdown symbols (* # _ [ ] `) in a single pass
+        text = text.translate(_SPEECH_STRIP_TABLE)
         
         # Remove parentheses content that looks like citations or references
-        text = re.sub(r'\([^)]*\)', '', text)
+        text = _PARENS_RE.sub('', text)
         
         # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove code blocks and backticks
-        text = text.replace('`', '')
+        text = _WHITESPACE_RE.sub(' ', text)
         
         return text.strip()
 
     async def _async_speak(self, text):
-        """Async helper for edge-tts."""
+        """Async helper for edge-tts: stream the MP3 into memory."""
         communicate = edge_tts.Communicate(text, self.voice_name)
-        await communicate.save(self.temp_file)
+        audio = io.BytesIO()
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                audio.write(chunk["data"])
+        audio.seek(0)
+        return audio
+
+    def _synthesize(self, text):
+        """Synthesize text on the shared event loop and decode it into a Sound."""
+        audio = asyncio.run_coroutine_threadsafe(self._async_speak(text), self._loop).result()
+        return pygame.mixer.Sound(file=audio)
+
+    def _play(self, sound):
+        """Play a decoded Sound and block until it ends. Returns True if interrupted."""
+        self._stop_event.clear()
+        self._channel.play(sound)
+        
+        # Sleep for the clip's length in one wait; ESC/ENTER wakes it early
+        timeout = sound.get_length()
+        while True:
+            if self._stop_event.wait(timeout=timeout):
+                print(Fore.YELLOW + "⏸️ Speech interrupted by user")
+                self._channel.stop()
+                return True
+            if not self._channel.get_busy():
+                return False
+            timeout = 0.05  # mixer still draining its last buffer
 
     def speak(self, text):
         """Converts text to speech using Microsoft Edge TTS."""
@@ -62,50 +115,105 @@ class AlfredVoice:
         clean_text = self.clean_text_for_speech(text)
         
         print(Fore.YELLOW + f"🔊 Speaking: '{clean_text[:50]}...'")
-        sys.stdout.flush()
         
         try:
-            # Generate speech file with cleaned text
-            asyncio.run(self._async_speak(clean_text))
-            
-            # Unload any previous audio to release file lock
-            if pygame.mixer.music.get_busy():
-                pygame.mixer.music.stop()
-            pygame.mixer.music.unload()
-            
-            # Play audio synchronously (blocks until complete)
-            pygame.mixer.music.load(self.temp_file)
-            pygame.mixer.music.play()
+            # Synthesize straight into memory (no temp file on disk)
+            sound = self._synthesize(clean_text)
             
             print(Fore.GREEN + "✓ Playing audio...")
-            sys.stdout.flush()
-            
-            # Wait until audio finishes playing (with keyboard interrupt support)
             print(Fore.CYAN + "💡 Press ESC or ENTER to interrupt speech")
-            while pygame.mixer.music.get_busy():
-                # Check for ESC or ENTER key to stop speech
-                if keyboard.is_pressed('esc') or keyboard.is_pressed('enter'):
-                    print(Fore.YELLOW + "⏸️ Speech interrupted by user")
-                    pygame.mixer.music.stop()
-                    break
-                time.sleep(0.1)
             
-            # Unload to release file lock for next time
-            pygame.mixer.music.unload()
+            # Play audio synchronously (blocks until complete)
+            self._play(sound)
             
             print(Fore.CYAN + "✓ Speech completed, ready to listen")
-            sys.stdout.flush()
             
             # Small buffer to ensure microphone doesn't pick up tail end
             time.sleep(0.5)
             
         except Exception as e:
             print(Fore.RED + f"Speech Error: {e}")
-            pygame.mixer.music.unload()  # Cleanup on error too
-            sys.stdout.flush()
+
+    def begin_reply(self):
+        """
+        Start a new reply and return its token for say(). Anything still
+        queued from earlier replies is dropped.
+        """
+        with self._reply_lock:
+            self._reply += 1
+            self._reply_interrupted = False
+            return self._reply
+
+    def _is_live(self, reply):
+        """True if sentences of this reply should still be spoken."""
+        with self._reply_lock:
+            return reply == self._reply and not self._reply_interrupted
+
+    def say(self, text, reply=None):
+        """
+        Queue text (typically one sentence) for background speech and return
+        immediately. reply is the token from begin_reply() (default: the
+        current reply); once that reply is interrupted, further text for it
+        is dropped. Use wait_until_done() before listening again.
+        """
+        if not text:
+            return
+        if reply is None:
+            with self._reply_lock:
+                reply = self._reply
+        if not self._is_live(reply):
+            return
+        self._start_pipeline()
+        self._text_queue.put((reply, text))
+
+    def wait_until_done(self):
+        """Block until every queued sentence has been spoken (or discarded)."""
+        if not self._pipeline_started:
+            return
+        self._text_queue.join()
+        self._audio_queue.join()
+        # Small buffer to ensure microphone doesn't pick up tail end
+        time.sleep(0.5)
+
+    def _start_pipeline(self):
+        """Start the synthesis and playback threads on first use."""
+        with self._pipeline_lock:
+            if self._pipeline_started:
+                return
+            threading.Thread(target=self._synthesis_loop, daemon=True, name="TTSSynth").start()
+            threading.Thread(target=self._playback_loop, daemon=True, name="TTSPlayback").start()
+            self._pipeline_started = True
+
+    def _synthesis_loop(self):
+        """Worker: turn queued sentences into audio for the playback thread."""
+        while True:
+            reply, text = self._text_queue.get()
+            try:
+                if self._is_live(reply):
+                    clean_text = self.clean_text_for_speech(text)
+                    if clean_text:
+                        sound = self._synthesize(clean_text)
+                        self._audio_queue.put((reply, sound))
+            except Exception as e:
+                print(Fore.RED + f"Speech Error: {e}")
+            finally:
+                self._text_queue.task_done()
+
+    def _playback_loop(self):
+        """Worker: play synthesized sentences back to back."""
+        while True:
+            reply, sound = self._audio_queue.get()
+            try:
+                if self._is_live(reply) and self._play(sound):
+                    # Interrupted: drop the rest of this reply, queued or still to come
+                    with self._reply_lock:
+                        if reply == self._reply:
+                            self._reply_interrupted = True
+            except Exception as e:
+                print(Fore.RED + f"Speech Error: {e}")
+            finally:
+                self._audio_queue.task_done()
 
     def stop(self):
         """Stops any current playback."""
-        if pygame.mixer.music.get_busy():
-            pygame.mixer.music.stop()
-        pygame.mixer.music.unload()
+        self._channel.stop()
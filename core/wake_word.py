@@ -5,6 +5,7 @@ Uses OpenWakeWord for efficient, on-device wake word recognition.
 
 import os
 import json
+import struct
 from pathlib import Path
 from typing import Optional, List
 from colorama import Fore
@@ -12,7 +13,6 @@ from colorama import Fore
 try:
     import numpy as np
     import sounddevice as sd
-    import wave
     AUDIO_AVAILABLE = True
 except ImportError:
     AUDIO_AVAILABLE = False
@@ -24,6 +24,55 @@ try:
 except ImportError:
     OPENWAKEWORD_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_WAKE_WORDS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "wake_words")
+_CONFIG_PATH = os.path.join(_WAKE_WORDS_DIR, "config.json")
+
+# Config file contents: path -> (mtime_ns, raw bytes). Parsed per call, so
+# every caller gets its own dict to mutate.
+_config_cache = {}
+
+
+def _read_config(path) -> Optional[dict]:
+    """
+    Read a wake word config file, reusing its contents while the file is
+    unchanged on disk.
+    
+    Returns:
+        Parsed config, or None if the file does not exist
+    """
+    path = str(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    
+    cached = _config_cache.get(path)
+    if cached and cached[0] == mtime:
+        data = cached[1]
+    else:
+        with open(path, 'rb') as f:
+            data = f.read()
+        _config_cache[path] = (mtime, data)
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _write_config(path, config: dict):
+    """Write a wake word config file and refresh its cache entry."""
+    path = str(path)
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+    _config_cache[path] = (os.stat(path).st_mtime_ns, data)
+
 
 class WakeWordTrainer:
     """
@@ -36,6 +85,7 @@ class WakeWordTrainer:
     
     SAMPLE_RATE = 16000
     DURATION = 2.0  # seconds per recording
+    SAMPLE_WIDTH = 2  # int16 PCM, mono
     
     def __init__(self, data_dir: str = None):
         """
@@ -45,23 +95,36 @@ class WakeWordTrainer:
             data_dir: Directory to store training data and models
         """
         if data_dir is None:
-            data_dir = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)), 
-                "data", 
-                "wake_words"
-            )
+            data_dir = _WAKE_WORDS_DIR
         
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         self.config_path = self.data_dir / "config.json"
         self.config = self._load_config()
+        
+        # Every sample has the same length, so the recording buffer and the
+        # 44-byte WAV header are built once and reused for each sample.
+        self._frames = int(self.DURATION * self.SAMPLE_RATE)
+        self._buffer = None
+        self._wav_header = self._build_wav_header(self._frames * self.SAMPLE_WIDTH)
+    
+    def _build_wav_header(self, data_size: int) -> bytes:
+        """Build a canonical 44-byte PCM WAV header for data_size bytes of audio."""
+        byte_rate = self.SAMPLE_RATE * self.SAMPLE_WIDTH
+        return struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, 1, self.SAMPLE_RATE, byte_rate,
+            self.SAMPLE_WIDTH, self.SAMPLE_WIDTH * 8,
+            b'data', data_size
+        )
     
     def _load_config(self) -> dict:
         """Load or create wake word configuration."""
-        if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+        config = _read_config(self.config_path)
+        if config is not None:
+            return config
         return {
             "active_wake_word": "alfred",
             "custom_models": [],
@@ -70,16 +133,33 @@ class WakeWordTrainer:
     
     def _save_config(self):
         """Save configuration to disk."""
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        _write_config(self.config_path, self.config)
+    
+    def _open_stream(self):
+        """Open a mono int16 input stream matching the training format."""
+        return sd.InputStream(samplerate=self.SAMPLE_RATE, channels=1, dtype='int16')
     
-    def record_sample(self, wake_word: str, sample_num: int) -> str:
+    def _record_into(self, stream, buf):
+        """
+        Fill buf from an already-running input stream.
+        
+        Audio buffered while waiting for the user is discarded first,
+        so the recording starts now rather than at the last read.
+        """
+        stale = stream.read_available
+        if stale:
+            stream.read(stale)
+        data, _ = stream.read(len(buf))
+        buf[:] = data
+    
+    def record_sample(self, wake_word: str, sample_num: int, stream=None) -> str:
         """
         Record a single wake word sample.
         
         Args:
             wake_word: Name of the wake word
             sample_num: Sample number (for creating multiple samples)
+            stream: Open input stream to record from (opens one-shot if None)
         
         Returns:
             Path to saved audio file
@@ -101,23 +181,21 @@ class WakeWordTrainer:
         time.sleep(0.5)
         print(Fore.GREEN + "   🔴 RECORDING...")
         
-        # Record audio
-        audio_data = sd.rec(
-            int(self.DURATION * self.SAMPLE_RATE),
-            samplerate=self.SAMPLE_RATE,
-            channels=1,
-            dtype='int16'
-        )
-        sd.wait()  # Wait for recording to complete
+        # Record audio into the reusable buffer
+        if self._buffer is None:
+            self._buffer = np.empty((self._frames, 1), dtype=np.int16)
+        if stream is not None:
+            self._record_into(stream, self._buffer)
+        else:
+            sd.rec(out=self._buffer, samplerate=self.SAMPLE_RATE)
+            sd.wait()  # Wait for recording to complete
         
         print(Fore.GREEN + "   ✓ Recording complete!")
         
-        # Save to WAV file
-        with wave.open(str(output_path), 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(self.SAMPLE_RATE)
-            wf.writeframes(audio_data.tobytes())
+        # Save to WAV file (header template + zero-copy view of the samples)
+        with open(output_path, 'wb') as f:
+            f.write(self._wav_header)
+            f.write(memoryview(self._buffer).cast('B'))
         
         # Update config
         if wake_word not in self.config['recordings']:
@@ -147,10 +225,13 @@ class WakeWordTrainer:
         print(Fore.YELLOW + "\nPress Enter to start recording each sample...")
         
         samples = []
-        for i in range(1, num_samples + 1):
-            input(Fore.WHITE + f"\n[{i}/{num_samples}] Press Enter when ready...")
-            path = self.record_sample(wake_word, i)
-            samples.append(path)
+        # One stream for the whole session; opening it per sample costs
+        # more than the gap between recordings
+        with self._open_stream() as stream:
+            for i in range(1, num_samples + 1):
+                input(Fore.WHITE + f"\n[{i}/{num_samples}] Press Enter when ready...")
+                path = self.record_sample(wake_word, i, stream=stream)
+                samples.append(path)
         
         print(Fore.GREEN + f"\n✓ Collected {len(samples)} samples for '{wake_word}'")
         print(Fore.CYAN + f"  Samples saved to: {self.data_dir / wake_word}")
@@ -252,15 +333,9 @@ class WakeWordDetector:
         
         # Load configuration
         if config_path is None:
-            config_path = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                "data", "wake_words", "config.json"
-            )
+            config_path = _CONFIG_PATH
         
-        self.config = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                self.config = json.load(f)
+        self.config = _read_config(config_path) or {}
         
         # Get active wake word
         self.wake_word = self.config.get('active_wake_word', 'alfred')
@@ -286,18 +361,27 @@ class WakeWordDetector:
             print(Fore.YELLOW + "  For best results, run core/wake_word.py to train a custom 'alfred' model.")
         
         try:
-            self.model = Model(wakeword_models=[model_name], inference_framework="onnx")
+            # The models are tiny: one ONNX Runtime thread each (ncpu covers the
+            # melspectrogram/embedding sessions) keeps them from contending with
+            # the audio and UI threads.
+            self.model = Model(wakeword_models=[model_name], inference_framework="onnx", ncpu=1)
+            self._warm_up()
             print(Fore.GREEN + f"✓ Wake word detector ready (using '{model_name}' model)")
         except Exception as e:
             print(Fore.RED + f"✗ Failed to load wake word model: {e}")
             self.enabled = False
     
+    def _warm_up(self):
+        """Run one prediction on silence so first-use setup happens at load time."""
+        self.model.predict(np.zeros(1280, dtype=np.int16))
+        self.model.reset()
+    
     def detect(self, audio_chunk: np.ndarray, threshold: float = 0.5) -> bool:
         """
         Check if audio chunk contains wake word.
         
         Args:
-            audio_chunk: Audio data (float32, normalized to -1..1)
+            audio_chunk: Audio data (16 kHz, 16-bit PCM as int16)
             threshold: Detection threshold (0-1)
         
         Returns:
@@ -1,5 +1,9 @@
+import re
 import sys
 import time
+import queue
+import threading
+from concurrent.futures import TimeoutError as FuturesTimeout
 import keyboard
 from dotenv import load_dotenv # pip install python-dotenv
 from PyQt6.QtWidgets import QApplication
@@ -13,39 +17,163 @@ load_dotenv()
 from core.brain import AlfredBrain
 from core.voice import AlfredVoice
 from core.overlay import OverlayWindow, COLOR_SYSTEM_OK, COLOR_ACTIVE_SCAN
-from core.ears import listen_and_transcribe, listen_for_wake_word, OPENWAKEWORD_AVAILABLE
+from core.ears import (listen_and_transcribe, listen_for_wake_word, record_command,
+                       transcribe_async, load_models, wake_word_ready)
+from core.eyes import take_screenshot_async
 import config
 
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
 
+# Flush console output at each newline (even when redirected to a file),
+# so status lines appear promptly without explicit flush() calls
+sys.stdout.reconfigure(line_buffering=True)
+
 init(autoreset=True)
 
+# Command checks, compiled once. Vision keywords match anywhere ("looking",
+# "screenshot"); exit needs whole words ("quite" is not "quit")
+VISION_RE = re.compile('|'.join(map(re.escape, config.VISION_KEYWORDS)), re.IGNORECASE)
+EXIT_RE = re.compile(r'\b(?:exit|quit)\b', re.IGNORECASE)
+
+# Token posted to the worker's wake queue (by the listener or a manual trigger)
+WAKE = "wake"
+
+
+class WakeWordListener(QThread):
+    """
+    Background thread that blocks on the microphone for the wake word
+    and posts a WAKE token to the worker's queue when it is heard.
+    Only listens while armed, so it never competes with command recording.
+    """
+    
+    def __init__(self, wake_q):
+        super().__init__()
+        self.wake_q = wake_q
+        self.running = True
+        self._armed = threading.Event()
+        self._stop = threading.Event()
+    
+    def arm(self):
+        """Start (or keep) listening for the wake word."""
+        self._stop.clear()
+        self._armed.set()
+    
+    def disarm(self):
+        """Stop listening and release the microphone."""
+        self._armed.clear()
+        self._stop.set()
+    
+    def shutdown(self):
+        """Stop the thread and wait for it to exit."""
+        self.running = False
+        self.disarm()
+        self._armed.set()  # unblock the idle wait
+        self.wait(2000)
+    
+    def run(self):
+        while self.running:
+            self._armed.wait()
+            if not self.running:
+                break
+            heard = listen_for_wake_word(config.WAKE_WORD, stop_event=self._stop)
+            # A wake heard as the worker disarmed (e.g. on a manual trigger) is stale
+            if heard and not self._stop.is_set():
+                self._armed.clear()
+                self.wake_q.put(WAKE)
+
 
 class AlfredWorker(QThread):
     """
     Background thread that handles Listening -> Thinking -> Acting.
     """
     status_update = pyqtSignal(str)
-    color_update = pyqtSignal(object)
+    ui_update = pyqtSignal(str, object)  # text + colour in a single cross-thread event
     wake_signal = pyqtSignal() # external wake trigger
     
     def __init__(self):
         super().__init__()
         self.running = True
-        self.brain = AlfredBrain()
-        self.voice = AlfredVoice()
+        # Loaded in parallel once the thread starts (see _load_cores),
+        # so the overlay is up while the models load
+        self.brain = None
+        self.voice = None
         
-        # Flag for manual wake
-        self.manual_wake = False
+        # Wake events (wake word or manual trigger) arrive on this queue
+        self._wake_q = queue.Queue()
+        # Created once the wake word detector has loaded (see run)
+        self.wake_listener = None
         self.wake_signal.connect(self.trigger_wake)
+        self._last_status = None
         
+    def _emit_status(self, text):
+        """Send a status line to the overlay, skipping repeats of the one shown."""
+        if text != self._last_status:
+            self._last_status = text
+            self.status_update.emit(text)
+
     def trigger_wake(self):
-        self.manual_wake = True
+        self._wake_q.put(WAKE)
+
+    def _drain_wakes(self):
+        """Drop wakes queued alongside the one just handled (e.g. manual + wake word)."""
+        while True:
+            try:
+                self._wake_q.get_nowait()
+            except queue.Empty:
+                return
+
+    def _listen(self):
+        """
+        Record a command, then wait for Whisper on the ASR thread while
+        keeping the overlay status ticking. Returns "" if nothing was heard.
+        """
+        pcm = record_command()
+        if pcm is None:
+            return ""
+        
+        future = transcribe_async(pcm)
+        start = time.monotonic()
+        self._emit_status("🧠 Transcribing...")
+        while True:
+            try:
+                return future.result(timeout=0.25)
+            except FuturesTimeout:
+                elapsed = int(time.monotonic() - start)
+                if elapsed:
+                    self._emit_status(f"🧠 Transcribing... {elapsed}s")
+
+    def _load_cores(self):
+        """Construct the brain and voice and load the ears concurrently. Returns False if any failed."""
+        loaded = {}
+        errors = []
+        
+        def load(name, factory):
+            try:
+                loaded[name] = factory()
+            except Exception as e:
+                errors.append(e)
+                print(Fore.RED + f"Failed to initialize {name}: {e}")
+        
+        loaders = [threading.Thread(target=load, args=("brain", AlfredBrain), name="BrainInit"),
+                   threading.Thread(target=load, args=("voice", AlfredVoice), name="VoiceInit"),
+                   threading.Thread(target=load, args=("ears", load_models), name="EarsInit")]
+        for t in loaders:
+            t.start()
+        for t in loaders:
+            t.join()
+        self.brain = loaded.get("brain")
+        self.voice = loaded.get("voice")
+        return not errors
 
     def run(self):
         """Main execution loop."""
-        self.status_update.emit(f"{config.WAKE_WORD.capitalize()} Online")
+        self._emit_status("⚙ Booting cores...")
+        if not self._load_cores():
+            self._emit_status("❌ System Error")
+            return
+        
+        self._emit_status(f"{config.WAKE_WORD.capitalize()} Online")
         self.voice.speak(f"{config.WAKE_WORD.capitalize()} is online.")
         
         print(Fore.WHITE + "\n-----------------------------------")
@@ -54,6 +182,10 @@ class AlfredWorker(QThread):
         print(Fore.WHITE + "-----------------------------------\n")
         
         in_conversation = False
+        # Without a working detector the loop below falls back to Whisper itself
+        if wake_word_ready():
+            self.wake_listener = WakeWordListener(self._wake_q)
+            self.wake_listener.start()
         
         while self.running:
             try:
@@ -61,86 +193,103 @@ class AlfredWorker(QThread):
                 user_text = ""
                 
                 if not in_conversation:
-                    # Check manual wake first
-                    if self.manual_wake:
-                        user_text = config.WAKE_WORD
-                        self.manual_wake = False
-                    
-                    # Wake Word Check (if not manual)
-                    elif OPENWAKEWORD_AVAILABLE:
-                        # Use timeout=1 to unblock periodically and check signals
-                        if listen_for_wake_word(config.WAKE_WORD, timeout=1):
-                            user_text = config.WAKE_WORD # Trigger activation
-                        else:
+                    if self.wake_listener is not None:
+                        # Sleep until the listener thread or a manual trigger posts a wake
+                        self.wake_listener.arm()
+                        try:
+                            self._wake_q.get(timeout=5)
+                        except queue.Empty:
                             continue
+                        self.wake_listener.disarm()
+                        self._drain_wakes()
+                        user_text = config.WAKE_WORD # Trigger activation
                     else:
-                        # Fallback Whisper
-                        audio_text = listen_and_transcribe()
-                        if audio_text and config.WAKE_WORD.lower() in audio_text.lower():
-                            user_text = audio_text
-                        else:
-                            continue
+                        # Check manual wake first
+                        try:
+                            self._wake_q.get_nowait()
+                            self._drain_wakes()
+                            user_text = config.WAKE_WORD
+                        except queue.Empty:
+                            # Fallback Whisper
+                            audio_text = listen_and_transcribe()
+                            if audio_text and config.WAKE_WORD.lower() in audio_text.lower():
+                                user_text = audio_text
+                            else:
+                                continue
                 else:
                     # Active Conversation Listening
-                    user_text = listen_and_transcribe()
+                    user_text = self._listen()
                     
-                if not user_text and not self.manual_wake:
+                if not user_text:
                     if in_conversation:
                         print(Fore.CYAN + "💤 Conversation timeout.")
-                        self.status_update.emit("💤 Idle")
+                        self._emit_status("💤 Idle")
                         in_conversation = False
                     continue
 
                 # 2. Activation / Interaction
                 if not in_conversation:
                     print(Fore.WHITE + f"\n🎯 Wake Word Detected!")
-                    self.status_update.emit("🎯 Activated")
+                    self._emit_status("🎯 Activated")
                     self.voice.speak("Yes?")
                     in_conversation = True
                     
                     # Listen for command immediately
-                    self.status_update.emit("🎤 Listening...")
-                    user_text = listen_and_transcribe()
+                    self._emit_status("🎤 Listening...")
+                    user_text = self._listen()
                     if not user_text:
                         self.voice.speak("I didn't hear a command, Sir.")
                         in_conversation = False
-                        self.status_update.emit("")
+                        self._emit_status("")
                         continue
 
                 # 3. Process Command
                 print(Fore.WHITE + f"Command: {user_text}")
-                self.status_update.emit(f"📝 {user_text[:30]}..." if len(user_text) > 30 else f"📝 {user_text}")
+                self._emit_status(f"📝 {user_text[:30]}..." if len(user_text) > 30 else f"📝 {user_text}")
                 
                 # Check for exit
-                if "exit" in user_text.lower() or "quit" in user_text.lower():
+                if EXIT_RE.search(user_text):
                     self.voice.speak("Shutting down, Sir.")
-                    self.status_update.emit("👋 Shutting down...")
+                    self._emit_status("👋 Shutting down...")
                     self.running = False
                     QApplication.instance().quit()
                     break
 
                 # UI Callback
                 def update_ui(text, color):
-                    self.status_update.emit(text)
-                    self.color_update.emit(color)
+                    self._last_status = text
+                    self.ui_update.emit(text, color)
+
+                # Replies are spoken sentence by sentence as they stream in;
+                # interrupting one sentence drops the rest of this reply
+                spoken = []
+                reply = self.voice.begin_reply()
+                def speak_sentence(sentence):
+                    spoken.append(sentence)
+                    self.voice.say(sentence, reply)
 
                 # 4. THINK & ACT
                 # Check Vision
-                vision_keywords = config.VISION_KEYWORDS
-                if any(k in user_text.lower() for k in vision_keywords):
-                    from core.eyes import take_screenshot
-                    self.status_update.emit("👀 Looking...")
+                if VISION_RE.search(user_text):
+                    self._emit_status("👀 Looking...")
+                    # Grab the screen now and encode it while the confirmation plays
+                    img_future = take_screenshot_async()
                     self.voice.speak("Taking a look.")
-                    img = take_screenshot()
-                    response = self.brain.process_vision(user_text, img, update_ui)
+                    img = img_future.result()
+                    response = self.brain.process_vision(user_text, img, update_ui, on_sentence=speak_sentence)
                 else:
-                    self.status_update.emit("🧠 Thinking...")
-                    response = self.brain.think(user_text, update_ui)
+                    self._emit_status("🧠 Thinking...")
+                    response = self.brain.think(user_text, update_ui, on_sentence=speak_sentence)
+                if spoken:
+                    response = None
                 
                 # 5. SPEAK
-                self.voice.speak(response)
+                if response is None:
+                    self.voice.wait_until_done()
+                else:
+                    self.voice.speak(response)
                 
-                self.status_update.emit("🎤 Listening...")
+                self._emit_status("🎤 Listening...")
                 print(Fore.CYAN + "🎤 Listening for follow-up...")
 
             except KeyboardInterrupt:
@@ -148,8 +297,11 @@ class AlfredWorker(QThread):
                 break
             except Exception as e:
                 print(Fore.RED + f"Critical Loop Error: {e}")
-                self.status_update.emit("❌ System Error")
+                self._emit_status("❌ System Error")
                 time.sleep(2)
+        
+        if self.wake_listener is not None:
+            self.wake_listener.shutdown()
 
 if __name__ == "__main__":
     try:
@@ -160,7 +312,7 @@ if __name__ == "__main__":
         
         worker = AlfredWorker()
         worker.status_update.connect(overlay.set_text)
-        worker.color_update.connect(overlay.set_sentiment_color)
+        worker.ui_update.connect(overlay.show_response)
         
         # Connect Wake Signal
         overlay.wake_request.connect(worker.wake_signal.emit)
@@ -12,7 +12,7 @@ import getpass
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from colorama import Fore, init
-from core.encryption import encrypt_file, decrypt_file
+from core.encryption import derive_key, encrypt_file, decrypt_file
 
 init(autoreset=True)
 
@@ -70,12 +70,14 @@ def main():
     
     # Encrypt
     try:
-        output_path = encrypt_file(brain_path, password, encrypted_path)
+        # Key derivation is deliberately slow; do it once for encrypt + verify
+        key = derive_key(password)
+        output_path = encrypt_file(brain_path, password, encrypted_path, key=key)
         print(Fore.GREEN + f"\n✓ Successfully encrypted to: {output_path}")
         
         # Verify by decrypting
         print(Fore.CYAN + "  Verifying encryption...")
-        decrypted = decrypt_file(encrypted_path, password)
+        decrypted = decrypt_file(encrypted_path, password, key=key)
         
         if decrypted == content:
             print(Fore.GREEN + "✓ Verification passed - encryption is working correctly!")
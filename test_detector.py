@@ -1,3 +1,5 @@
+import time
+import numpy as np
 from core.wake_word import WakeWordDetector
 import config
 from colorama import init, Fore
@@ -12,6 +14,17 @@ try:
     if detector.enabled:
         print(f"Model Map for current word: {detector.model_map.get(detector.wake_word.lower())}")
         print(f"Configured Threshold: {config.WAKE_WORD_THRESHOLD}")
+        
+        # Measure inference cost per 80 ms frame (target: < 5 ms)
+        frame = np.zeros(1280, dtype=np.int16)
+        runs = 50
+        start = time.perf_counter()
+        for _ in range(runs):
+            detector.model.predict(frame)
+        per_frame_ms = (time.perf_counter() - start) * 1000 / runs
+        detector.model.reset()
+        color = Fore.GREEN if per_frame_ms < 5 else Fore.YELLOW
+        print(color + f"Predict time: {per_frame_ms:.2f} ms per 80 ms frame ({80 / per_frame_ms:.0f}x realtime)")
     else:
         print("Detector disabled. Check logs above.")
 except Exception as e:
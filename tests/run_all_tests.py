@@ -7,57 +7,78 @@ Runs all test suites and provides a unified summary report.
 import sys
 import os
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from colorama import Fore, init
-init(autoreset=True)
+from colorama import Fore
 
 from test_utils import (SYM_CHECK, SYM_FAIL, SYM_WARN, SYM_PLAY, SYM_CHART, 
-                        SYM_BOX_H, SYM_BOX_V, SYM_PARTY, SAFE_MODE)
+                        SYM_BOX_H, SYM_BOX_V, SYM_PARTY, SAFE_MODE, _PROJECT_ROOT)
+
+
+# Lines of each suite's output kept for the report (the rest is discarded)
+OUTPUT_TAIL_LINES = 10
+SUITE_TIMEOUT = 120  # seconds
+
+# Environment for every suite, built once: force UTF-8 so printing unicode can't crash
+_SUITE_ENV = {**os.environ, "PYTHONIOENCODING": "utf-8", "PYTHONUTF8": "1"}
 
 
 def run_test_file(test_file: str, test_name: str) -> tuple:
     """
     Run a test file and capture results.
+    Output is read line by line as it is produced; only the last
+    OUTPUT_TAIL_LINES lines are kept.
     
     Returns:
         (success: bool, output: str, duration: float)
     """
     start_time = time.time()
     
-    # Force UTF-8 encoding for subprocess to avoid crashes when printing unicode
-    env = os.environ.copy()
-    env["PYTHONIOENCODING"] = "utf-8"
-    env["PYTHONUTF8"] = "1"
-    
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [sys.executable, test_file],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
             encoding='utf-8',  # Explicitly read as UTF-8
             errors='replace',  # Handle bad chars gracefully
-            timeout=120,  # 2 minute timeout per test suite
-            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            env=env
+            cwd=_PROJECT_ROOT,
+            env=_SUITE_ENV
         )
-        
-        duration = time.time() - start_time
-        success = result.returncode == 0
-        output = result.stdout + result.stderr
-        
-        return (success, output, duration)
-        
-    except subprocess.TimeoutExpired:
-        return (False, "TIMEOUT: Test took too long", time.time() - start_time)
     except Exception as e:
         return (False, f"ERROR: {str(e)}", time.time() - start_time)
+    
+    # A suite that hangs without printing would block the read loop,
+    # so the timeout is enforced by killing the process from a timer
+    timed_out = threading.Event()
+    def kill():
+        timed_out.set()
+        proc.kill()
+    killer = threading.Timer(SUITE_TIMEOUT, kill)
+    killer.start()
+    try:
+        tail = deque(proc.stdout, maxlen=OUTPUT_TAIL_LINES)
+        proc.wait()
+    finally:
+        killer.cancel()
+        proc.stdout.close()
+    
+    duration = time.time() - start_time
+    if timed_out.is_set():
+        return (False, "TIMEOUT: Test took too long", duration)
+    
+    return (proc.returncode == 0, "".join(tail), duration)
 
 
 def main():
+    # Legacy Windows consoles can't encode every character the suites print;
+    # substitute '?' at the console rather than sanitizing line by line
+    if SAFE_MODE and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors='replace')
+    
     print(Fore.CYAN + "=" * 60)
     print(Fore.CYAN + "  🤵 ALFRED - Master Test Suite Runner")
     print(Fore.CYAN + "=" * 60)
@@ -73,45 +94,52 @@ def main():
         ("test_memory.py", "Memory Persistence Tests"),
         ("test_encryption.py", "Encryption Module Tests"),
         ("test_tools_security.py", "Security Tests"),
+        ("test_cache.py", "Response Cache Tests"),
+        ("test_brain.py", "Brain Tests"),
+        ("test_voice.py", "Voice Pipeline Tests"),
+        ("test_routing.py", "Command Routing Tests"),
     ]
     
-    results = []
     total_start = time.time()
     
+    # Suites are independent processes, so run them all at once; each
+    # thread just waits on its subprocess
+    pending = []
     for test_file, test_name in test_suites:
         test_path = os.path.join(tests_dir, test_file)
         
         if not os.path.exists(test_path):
             print(Fore.YELLOW + f"{SYM_WARN} Skipping {test_name} - file not found")
             continue
+        pending.append((test_file, test_name, test_path))
+    
+    results = [None] * len(pending)
+    with ThreadPoolExecutor(max_workers=max(1, len(pending))) as executor:
+        futures = {executor.submit(run_test_file, test_path, test_name): i
+                   for i, (test_file, test_name, test_path) in enumerate(pending)}
         
-        print(Fore.WHITE + f"\n{SYM_PLAY} Running: {test_name}")
-        print(Fore.LIGHTBLACK_EX + "-" * 50)
-        
-        success, output, duration = run_test_file(test_path, test_name)
-        
-        results.append({
-            "name": test_name,
-            "file": test_file,
-            "success": success,
-            "duration": duration
-        })
-        
-        # Show abbreviated output
-        lines = output.strip().split('\n')
-        # Show last 10 lines (usually the summary)
-        for line in lines[-10:]:
-            # Sanitize output for Windows console if needed
-            if SAFE_MODE:
-                try:
-                    line.encode(sys.stdout.encoding)
-                except UnicodeEncodeError:
-                    line = line.encode(sys.stdout.encoding, errors='replace').decode(sys.stdout.encoding)
+        # Report each suite as it finishes (printed whole, so output never interleaves)
+        for future in as_completed(futures):
+            i = futures[future]
+            test_file, test_name, _ = pending[i]
+            success, output, duration = future.result()
             
-            print(Fore.LIGHTBLACK_EX + "  " + line)
-        
-        status = Fore.GREEN + "PASSED" if success else Fore.RED + "FAILED"
-        print(f"\n  Status: {status} ({duration:.2f}s)")
+            results[i] = {
+                "name": test_name,
+                "file": test_file,
+                "success": success,
+                "duration": duration
+            }
+            
+            print(Fore.WHITE + f"\n{SYM_PLAY} Finished: {test_name}")
+            print(Fore.LIGHTBLACK_EX + "-" * 50)
+            
+            # Show abbreviated output (the last lines, usually the summary)
+            for line in output.strip().split('\n'):
+                print(Fore.LIGHTBLACK_EX + "  " + line)
+            
+            status = Fore.GREEN + "PASSED" if success else Fore.RED + "FAILED"
+            print(f"\n  Status: {status} ({duration:.2f}s)")
     
     total_duration = time.time() - total_start
     
@@ -12,23 +12,22 @@ import tempfile
 sys.modules["pyautogui"] = MagicMock()
 sys.modules["pyperclip"] = MagicMock()
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from colorama import Fore, init
-init(autoreset=True)
+from colorama import Fore
 
 from test_utils import TestResults, SYM_CHECK, SYM_FAIL
 
-
-
+# Imported once for the whole suite (after the GUI mocks are installed)
+import pyperclip
+from core.tools import (open_application, get_system_status, google_search, system_volume,
+                        media_play_pause, media_next, media_previous, search_knowledge_base,
+                        _load_knowledge_base, _match_lines, get_current_time, get_weather, write_to_screen,
+                        TOOLS, TOOL_MAP)
 
 
 def test_open_application(results: TestResults):
     """Test open_application tool"""
     print(Fore.CYAN + "\n--- Testing open_application ---")
     
-    from core.tools import open_application
     
     # Test 1: Valid app from allowlist
     result = open_application.invoke({"app_name": "calculator"})
@@ -51,7 +50,15 @@ def test_open_application(results: TestResults):
     else:
         results.add_fail("Injection attack blocked", result)
     
-    # Test 4: Case insensitivity
+    # Test 4: Shell metacharacters rejected before any lookup
+    with patch("core.tools._launcher") as launcher:
+        result = open_application.invoke({"app_name": "notepad && calc"})
+    if "unsafe characters" in result and not launcher.called:
+        results.add_pass("Unsafe characters rejected up front")
+    else:
+        results.add_fail("Unsafe characters rejected up front", result)
+    
+    # Test 5: Case insensitivity
     result = open_application.invoke({"app_name": "CALCULATOR"})
     if "Successfully" in result or "not found" in result:
         results.add_pass("Case insensitive lookup")
@@ -63,7 +70,6 @@ def test_get_system_status(results: TestResults):
     """Test get_system_status tool"""
     print(Fore.CYAN + "\n--- Testing get_system_status ---")
     
-    from core.tools import get_system_status
     
     result = get_system_status.invoke({})
     
@@ -82,7 +88,6 @@ def test_google_search(results: TestResults):
     """Test google_search tool"""
     print(Fore.CYAN + "\n--- Testing google_search ---")
     
-    from core.tools import google_search
     
     # Mock webbrowser.open to prevent actual browser opening
     with patch('webbrowser.open') as mock_browser:
@@ -103,7 +108,6 @@ def test_system_volume(results: TestResults):
     """Test system_volume tool"""
     print(Fore.CYAN + "\n--- Testing system_volume ---")
     
-    from core.tools import system_volume
     
     # Test volume up
     result = system_volume.invoke({"action": "up"})
@@ -112,6 +116,13 @@ def test_system_volume(results: TestResults):
     else:
         results.add_fail("Volume up", result)
     
+    # Both key presses sent in one call, without pyautogui's pause
+    press = sys.modules["pyautogui"].press
+    if press.call_args == ((["volumeup", "volumeup"],), {"_pause": False}):
+        results.add_pass("Volume keys sent without pause")
+    else:
+        results.add_fail("Volume keys sent without pause", str(press.call_args))
+    
     # Test volume down
     result = system_volume.invoke({"action": "down"})
     if "Volume turned down" in result:
@@ -138,7 +149,6 @@ def test_media_controls(results: TestResults):
     """Test media control tools"""
     print(Fore.CYAN + "\n--- Testing media_controls ---")
     
-    from core.tools import media_play_pause, media_next, media_previous
     
     result = media_play_pause.invoke({})
     if "play/pause toggled" in result:
@@ -163,7 +173,6 @@ def test_search_knowledge_base(results: TestResults):
     """Test search_knowledge_base tool"""
     print(Fore.CYAN + "\n--- Testing search_knowledge_base ---")
     
-    from core.tools import search_knowledge_base
     
     # The tool now handles non-interactive mode by falling back to plain text
     # Test search for known content (if brain.txt exists)
@@ -180,12 +189,45 @@ def test_search_knowledge_base(results: TestResults):
     else:
         results.add_fail("Handles missing data gracefully", result)
 
+    # Test cache is reused until the file changes
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        brain_file = os.path.join(tmp_dir, "brain.txt")
+        with open(brain_file, 'w', encoding='utf-8') as f:
+            f.write("Dog name is Rex")
+
+        first = _load_knowledge_base(brain_file)
+        second = _load_knowledge_base(brain_file)
+        if first[0] is second[0] and second[1] == ["dog name is rex"]:
+            results.add_pass("Knowledge base cached between calls")
+        else:
+            results.add_fail("Knowledge base cached between calls", str(second))
+
+        with open(brain_file, 'w', encoding='utf-8') as f:
+            f.write("Cat name is Tom\n\n   \n")
+        stat = os.stat(brain_file)
+        os.utime(brain_file, (stat.st_atime, stat.st_mtime + 1))
+
+        reloaded = _load_knowledge_base(brain_file)
+        if reloaded == (["Cat name is Tom"], ["cat name is tom"]):
+            results.add_pass("Knowledge base reloaded after change (blank lines dropped)")
+        else:
+            results.add_fail("Knowledge base reloaded after change (blank lines dropped)", str(reloaded))
+
+    # Test matching: one result per line, in file order, never across lines
+    lines = ["WiFi: Home", "Pet: Rex the dog", "wifi guest: Cafe", "Dog food: kibble"]
+    lower_lines = [line.lower() for line in lines]
+    matches = (_match_lines(lines, lower_lines, "wifi"), _match_lines(lines, lower_lines, "dog"),
+               _match_lines(lines, lower_lines, "home\npet"))
+    if matches == (["WiFi: Home", "wifi guest: Cafe"], ["Pet: Rex the dog", "Dog food: kibble"], []):
+        results.add_pass("Knowledge base matches whole lines")
+    else:
+        results.add_fail("Knowledge base matches whole lines", str(matches))
+
 
 def test_get_current_time(results: TestResults):
     """Test get_current_time tool"""
     print(Fore.CYAN + "\n--- Testing get_current_time ---")
     
-    from core.tools import get_current_time
     import datetime
     
     result = get_current_time.invoke({})
@@ -207,7 +249,6 @@ def test_get_weather(results: TestResults):
     """Test get_weather tool with mocked API"""
     print(Fore.CYAN + "\n--- Testing get_weather ---")
     
-    from core.tools import get_weather
     
     # Mock API response
     mock_response = MagicMock()
@@ -227,18 +268,11 @@ def test_get_weather(results: TestResults):
             else:
                 results.add_fail("Returns weather data", result)
     
-    # Test missing API key
-    with patch.dict(os.environ, {"OPENWEATHER_API_KEY": ""}, clear=True):
-        # Remove the key temporarily
-        original = os.environ.get("OPENWEATHER_API_KEY")
-        if "OPENWEATHER_API_KEY" in os.environ:
-            del os.environ["OPENWEATHER_API_KEY"]
-        
+    # Test missing API key (patch.dict restores the environment afterwards)
+    with patch.dict(os.environ):
+        os.environ.pop("OPENWEATHER_API_KEY", None)
         result = get_weather.invoke({"city": "London"})
         
-        if original:
-            os.environ["OPENWEATHER_API_KEY"] = original
-        
         if "API key not found" in result or "Error" in result:
             results.add_pass("Handles missing API key")
         else:
@@ -249,11 +283,8 @@ def test_write_to_screen(results: TestResults):
     """Test write_to_screen tool (Ghost Writer)"""
     print(Fore.CYAN + "\n--- Testing write_to_screen ---")
     
-    from core.tools import write_to_screen
-    import pyperclip
-    
     # Reset mock
-    pyperclip.copy = MagicMock()
+    pyperclip.copy.reset_mock()
     
     result = write_to_screen.invoke({"text": "Hello World"})
     
@@ -263,6 +294,16 @@ def test_write_to_screen(results: TestResults):
         results.add_fail("Returns success message", result)
 
 
+
+def test_tool_registry(results: TestResults):
+    """Test the TOOLS registry and name lookup"""
+    print(Fore.CYAN + "\n--- Testing tool registry ---")
+    
+    if len(TOOLS) == 11 and all(TOOL_MAP[t.name] is t for t in TOOLS):
+        results.add_pass("All 11 tools registered by name")
+    else:
+        results.add_fail("All 11 tools registered by name", str(sorted(TOOL_MAP)))
+
 def main():
     print(Fore.CYAN + "=" * 55)
     print(Fore.CYAN + "  ALFRED Tools Test Suite")
@@ -271,15 +312,18 @@ def main():
     results = TestResults()
     
     # Run all tests
-    test_open_application(results)
-    test_get_system_status(results)
-    test_google_search(results)
-    test_system_volume(results)
-    test_media_controls(results)
-    test_search_knowledge_base(results)
-    test_get_current_time(results)
-    test_get_weather(results)
-    test_write_to_screen(results)
+    results.run(
+        test_open_application,
+        test_get_system_status,
+        test_google_search,
+        test_system_volume,
+        test_media_controls,
+        test_search_knowledge_base,
+        test_get_current_time,
+        test_get_weather,
+        test_write_to_screen,
+        test_tool_registry,
+    )
     
     # Summary
     print(Fore.CYAN + "\n" + "=" * 55)
@@ -0,0 +1,206 @@
+"""
+Tests for the LLM response cache.
+"""
+
+import sys
+import os
+import time
+
+from colorama import Fore
+
+from test_utils import TestResults, SYM_CHECK, SYM_FAIL
+
+
+def test_cache_keys(results: TestResults):
+    """Test that keys depend on message type, content and order"""
+    print(Fore.CYAN + "\n--- Testing Cache Keys ---")
+
+    from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+    from core.cache import ResponseCache
+
+    persona = SystemMessage(content="You are Alfred.")
+    key = ResponseCache.make_key([persona, HumanMessage(content="Hello")])
+
+    if key == ResponseCache.make_key([persona, HumanMessage(content="Hello")]):
+        results.add_pass("Same messages give same key")
+    else:
+        results.add_fail("Same messages give same key", "Keys differ")
+
+    if key != ResponseCache.make_key([persona, HumanMessage(content="Hello!")]):
+        results.add_pass("Different content gives different key")
+    else:
+        results.add_fail("Different content gives different key", "Keys match")
+
+    if key != ResponseCache.make_key([persona, AIMessage(content="Hello")]):
+        results.add_pass("Different message type gives different key")
+    else:
+        results.add_fail("Different message type gives different key", "Keys match")
+
+    if key == ResponseCache.make_key([persona, HumanMessage(content="  hello ")]):
+        results.add_pass("Case and whitespace ignored")
+    else:
+        results.add_fail("Case and whitespace ignored", "Keys differ")
+
+    if key != ResponseCache.make_key([persona, HumanMessage(content="Hello")], model="other-model"):
+        results.add_pass("Different model gives different key")
+    else:
+        results.add_fail("Different model gives different key", "Keys match")
+
+
+def test_cache_lookup(results: TestResults):
+    """Test get/put, LRU eviction and expiry"""
+    print(Fore.CYAN + "\n--- Testing Cache Lookup ---")
+
+    from core.cache import ResponseCache
+
+    cache = ResponseCache(max_entries=2, ttl=60)
+
+    if cache.get(b"missing") is None:
+        results.add_pass("Miss returns None")
+    else:
+        results.add_fail("Miss returns None", "Got a value")
+
+    cache.put(b"a", "Reply A")
+    if cache.get(b"a") == "Reply A":
+        results.add_pass("Stored reply returned")
+    else:
+        results.add_fail("Stored reply returned", str(cache.get(b"a")))
+
+    # "a" was just used, so adding a third entry should evict "b"
+    cache.put(b"b", "Reply B")
+    cache.get(b"a")
+    cache.put(b"c", "Reply C")
+    if cache.get(b"b") is None and cache.get(b"a") == "Reply A" and len(cache) == 2:
+        results.add_pass("Least recently used entry evicted")
+    else:
+        results.add_fail("Least recently used entry evicted", f"{len(cache)} entries")
+
+    expiring = ResponseCache(ttl=0.01)
+    expiring.put(b"a", "Reply A")
+    time.sleep(0.05)
+    if expiring.get(b"a") is None:
+        results.add_pass("Expired entry dropped")
+    else:
+        results.add_fail("Expired entry dropped", "Entry still returned")
+
+
+def test_semantic_cache(results: TestResults):
+    """Test similarity lookup, threshold and missing embedder"""
+    print(Fore.CYAN + "\n--- Testing Semantic Cache ---")
+
+    import numpy as np
+    from core.cache import SemanticCache
+
+    # Letter-count vectors: rewordings with the same letters are "similar"
+    def embed(text):
+        vec = np.zeros(26, dtype=np.float32)
+        for ch in text.lower():
+            if "a" <= ch <= "z":
+                vec[ord(ch) - ord("a")] += 1
+        return vec
+
+    cache = SemanticCache(embed, threshold=0.95, max_entries=2)
+    cache.put("what is the capital of france", "Paris, Sir.")
+
+    if cache.get("What is the capital of France?") == "Paris, Sir.":
+        results.add_pass("Similar prompt hits")
+    else:
+        results.add_fail("Similar prompt hits", "Miss")
+
+    if cache.get("play some music") is None:
+        results.add_pass("Unrelated prompt misses")
+    else:
+        results.add_fail("Unrelated prompt misses", "Hit")
+
+    cache.put("play some music", "Playing.")
+    cache.put("how tall is everest", "8,849 metres.")
+    if len(cache) == 2 and cache.get("what is the capital of france") is None:
+        results.add_pass("Oldest entry overwritten when full")
+    else:
+        results.add_fail("Oldest entry overwritten when full", f"{len(cache)} entries")
+
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        stored = SemanticCache(embed, threshold=0.95, path=path)
+        stored.put("what is the capital of france", "Paris, Sir.")
+        stored.close()
+
+        reloaded = SemanticCache(embed, threshold=0.95, path=path)
+        hit = reloaded.get("What is the capital of France?")
+        reloaded.close()
+    if hit == "Paris, Sir.":
+        results.add_pass("Entries reloaded from disk")
+    else:
+        results.add_fail("Entries reloaded from disk", str(hit))
+
+    scoped = SemanticCache(embed, threshold=0.95)
+    scoped.put("tell me more", "More about Paris, Sir.", context="conversation about paris")
+    hits = (scoped.get("tell me more", context="conversation about paris"),
+            scoped.get("tell me more", context="conversation about rome"))
+    if hits == ("More about Paris, Sir.", None):
+        results.add_pass("Entries only match in their own context")
+    else:
+        results.add_fail("Entries only match in their own context", str(hits))
+
+    import sqlite3
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        # A store written before entries had a context
+        db = sqlite3.connect(path)
+        db.execute("CREATE TABLE cache (id INTEGER PRIMARY KEY, prompt TEXT, response TEXT, embedding BLOB, ts REAL)")
+        db.execute("INSERT INTO cache VALUES (0, 'tell me more', 'Stale.', ?, ?)",
+                   ((embed("tell me more") / np.linalg.norm(embed("tell me more"))).tobytes(), time.time()))
+        db.commit()
+        db.close()
+
+        migrated = SemanticCache(embed, threshold=0.95, path=path)
+        stale = migrated.get("tell me more")
+        migrated.put("tell me more", "Fresh.")
+        migrated.close()
+    if stale is None:
+        results.add_pass("Entries without a context are not loaded")
+    else:
+        results.add_fail("Entries without a context are not loaded", str(stale))
+
+    disabled = SemanticCache(lambda text: None)
+    disabled.put("hello", "Hello, Sir.")
+    if disabled.get("hello") is None and len(disabled) == 0:
+        results.add_pass("No embedder disables cache")
+    else:
+        results.add_fail("No embedder disables cache", "Entry stored")
+
+
+def main():
+    print(Fore.CYAN + "=" * 55)
+    print(Fore.CYAN + "  ALFRED Response Cache Test Suite")
+    print(Fore.CYAN + "=" * 55)
+
+    results = TestResults()
+
+    results.run(
+        test_cache_keys,
+        test_cache_lookup,
+        test_semantic_cache,
+    )
+
+    # Summary
+    print(Fore.CYAN + "\n" + "=" * 55)
+    print(Fore.CYAN + "  TEST SUMMARY")
+    print(Fore.CYAN + "=" * 55)
+
+    total = results.passed + results.failed
+    print(f"\n  Total Tests: {total}")
+    print(Fore.GREEN + f"  Passed: {results.passed}")
+    print(Fore.RED + f"  Failed: {results.failed}")
+
+    if results.failed == 0:
+        print(Fore.GREEN + f"\n  {SYM_CHECK} ALL TESTS PASSED!")
+        return 0
+    else:
+        print(Fore.RED + f"\n  {SYM_FAIL} {results.failed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,25 +5,46 @@ Tests for the encryption module.
 import sys
 import os
 import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from colorama import Fore, init
-init(autoreset=True)
+from colorama import Fore
 
 from test_utils import TestResults, SYM_CHECK, SYM_FAIL
 
+import core.encryption
+
+_real_derive_key = core.encryption.derive_key
+
+
+def setup_module(module=None):
+    """
+    Test-only speedup: memoize derive_key so each password used below is run
+    through the (deliberately slow) KDF once instead of once per call.
+    """
+    core.encryption.derive_key = functools.lru_cache(maxsize=32)(_real_derive_key)
 
 
+def teardown_module(module=None):
+    """Restore the real, uncached derive_key."""
+    core.encryption.derive_key = _real_derive_key
+
+
+def _roundtrip(content, password):
+    """Encrypt then decrypt content. Returns (matched, error message or None)."""
+    from core.encryption import encrypt_content, decrypt_content
+    
+    try:
+        encrypted = encrypt_content(content, password)
+        return decrypt_content(encrypted, password) == content, None
+    except Exception as e:
+        return False, str(e)
 
 
 def test_encrypt_decrypt_roundtrip(results: TestResults):
     """Test that encryption and decryption work correctly"""
     print(Fore.CYAN + "\n--- Testing Encrypt/Decrypt Roundtrip ---")
     
-    from core.encryption import encrypt_content, decrypt_content
-    
     test_cases = [
         ("Simple text", "password123"),
         ("My WiFi password is 'SuperSecret'", "strongpass"),
@@ -32,23 +53,20 @@ def test_encrypt_decrypt_roundtrip(results: TestResults):
         ("Unicode: 你好世界 🌍", "unicode_pass"),
     ]
     
-    for content, password in test_cases:
-        try:
-            encrypted = encrypt_content(content, password)
-            decrypted = decrypt_content(encrypted, password)
-            
-            if decrypted == content:
-                # Use repr() to safely print unicode content
-                safe_content = repr(content)
-                if len(safe_content) > 25:
-                    safe_content = safe_content[:20] + "..." + safe_content[-1]
-                results.add_pass(f"Roundtrip: {safe_content}")
-            else:
-                safe_content = repr(content)
-                results.add_fail(f"Roundtrip: {safe_content}", "Content mismatch")
-        except Exception as e:
-            safe_content = repr(content)
-            results.add_fail(f"Roundtrip: {safe_content}", str(e))
+    # Cases are independent and the key derivation runs in native code,
+    # so run them side by side; results are reported in case order
+    with ThreadPoolExecutor(max_workers=len(test_cases)) as executor:
+        outcomes = list(executor.map(lambda case: _roundtrip(*case), test_cases))
+    
+    for (content, password), (matched, error) in zip(test_cases, outcomes):
+        # Use repr() to safely print unicode content
+        safe_content = repr(content)
+        if matched:
+            if len(safe_content) > 25:
+                safe_content = safe_content[:20] + "..." + safe_content[-1]
+            results.add_pass(f"Roundtrip: {safe_content}")
+        else:
+            results.add_fail(f"Roundtrip: {safe_content}", error or "Content mismatch")
 
 
 def test_wrong_password(results: TestResults):
@@ -82,14 +100,13 @@ def test_file_encryption(results: TestResults):
     test_content = "This is my personal knowledge base.\nMy WiFi password is 'TestPass123'."
     password = "file_password"
     
-    # Create temp file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(test_content)
-        plain_path = f.name
-    
-    encrypted_path = plain_path + '.enc'
-    
-    try:
+    # Everything lives in one temp directory, removed as a whole afterwards
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plain_path = os.path.join(tmp_dir, "plain.txt")
+        encrypted_path = plain_path + '.enc'
+        with open(plain_path, 'w', encoding='utf-8') as f:
+            f.write(test_content)
+        
         # Encrypt
         result_path = encrypt_file(plain_path, password, encrypted_path)
         
@@ -115,13 +132,6 @@ def test_file_encryption(results: TestResults):
             results.add_pass("File decryption successful")
         else:
             results.add_fail("File decryption successful", "Content mismatch")
-            
-    finally:
-        # Cleanup
-        if os.path.exists(plain_path):
-            os.remove(plain_path)
-        if os.path.exists(encrypted_path):
-            os.remove(encrypted_path)
 
 
 def test_secure_knowledge_base(results: TestResults):
@@ -133,12 +143,11 @@ def test_secure_knowledge_base(results: TestResults):
     test_content = "My name is Test User.\nMy favorite color is blue.\nMy WiFi is 'TestWiFi'."
     password = "kb_password"
     
-    # Create temp files
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(test_content)
-        plain_path = f.name
-    
-    try:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plain_path = os.path.join(tmp_dir, "brain.txt")
+        with open(plain_path, 'w', encoding='utf-8') as f:
+            f.write(test_content)
+        
         # Test with plain text file
         kb = SecureKnowledgeBase(plain_path, password=password)
         content = kb.load()
@@ -162,25 +171,16 @@ def test_secure_knowledge_base(results: TestResults):
         else:
             results.add_fail("Search returns empty for no match", f"Got {len(matches)} matches")
         
-        # Test with encrypted file
-        encrypted_path = plain_path + '.enc'
-        encrypt_file(plain_path, password, encrypted_path)
+        # Test with encrypted file (picked up automatically once it exists)
+        encrypt_file(plain_path, password, plain_path + '.enc')
         
         kb_enc = SecureKnowledgeBase(plain_path, password=password)
-        kb_enc._is_encrypted = True  # Force encrypted mode
-        kb_enc._content = None  # Reset cache
         
         content = kb_enc.load()
         if content == test_content:
             results.add_pass("Load encrypted file")
         else:
             results.add_fail("Load encrypted file", "Content mismatch")
-            
-    finally:
-        if os.path.exists(plain_path):
-            os.remove(plain_path)
-        if os.path.exists(plain_path + '.enc'):
-            os.remove(plain_path + '.enc')
 
 
 def test_key_derivation_consistency(results: TestResults):
@@ -215,11 +215,18 @@ def main():
     
     results = TestResults()
     
-    test_encrypt_decrypt_roundtrip(results)
-    test_wrong_password(results)
-    test_file_encryption(results)
-    test_secure_knowledge_base(results)
-    test_key_derivation_consistency(results)
+    setup_module()
+    try:
+        results.run(
+            test_encrypt_decrypt_roundtrip,
+            test_wrong_password,
+            test_file_encryption,
+            test_secure_knowledge_base,
+        )
+    finally:
+        teardown_module()
+    # Runs against the real derivation, not the cache
+    results.run(test_key_derivation_consistency)
     
     # Summary
     print(Fore.CYAN + "\n" + "=" * 55)
@@ -4,20 +4,35 @@ Tests for memory persistence (save/load) functionality.
 
 import sys
 import os
+import io
 import json
 import tempfile
 from unittest.mock import MagicMock, patch
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from colorama import Fore
 
-from colorama import Fore, init
-init(autoreset=True)
+# Same serializer as AlfredBrain's memory save/load
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-from test_utils import TestResults, SYM_CHECK, SYM_FAIL
+from test_utils import TestResults, SYMS
 
 
+def _save(f, memory_data):
+    """Write memory_data to a binary file object, as AlfredBrain saves it"""
+    if ORJSON_AVAILABLE:
+        f.write(orjson.dumps(memory_data, option=orjson.OPT_INDENT_2))
+    else:
+        f.write(json.dumps(memory_data, indent=2, ensure_ascii=False).encode('utf-8'))
+
 
+def _load(f):
+    """Decode memory data from a binary file object, as AlfredBrain loads it"""
+    data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 def test_memory_serialization(results: TestResults):
@@ -47,8 +62,8 @@ def test_memory_serialization(results: TestResults):
             }
             memory_data.append(msg_dict)
         
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            json.dump(memory_data, f, indent=2)
+        with open(temp_path, 'wb') as f:
+            _save(f, memory_data)
         
         # Check file was created
         if os.path.exists(temp_path):
@@ -58,8 +73,8 @@ def test_memory_serialization(results: TestResults):
             return
         
         # Test load
-        with open(temp_path, 'r', encoding='utf-8') as f:
-            loaded_data = json.load(f)
+        with open(temp_path, 'rb') as f:
+            loaded_data = _load(f)
         
         if len(loaded_data) == 3:
             results.add_pass("Correct number of messages loaded")
@@ -67,14 +82,13 @@ def test_memory_serialization(results: TestResults):
             results.add_fail("Correct number of messages loaded", f"Got {len(loaded_data)}")
         
         # Test message types preserved
+        # Type name -> message class, as in AlfredBrain.load_memory
+        message_types = {cls.__name__: cls for cls in (HumanMessage, AIMessage, SystemMessage)}
         loaded_memory = deque(maxlen=10)
         for msg_dict in loaded_data:
-            if msg_dict["type"] == "HumanMessage":
-                loaded_memory.append(HumanMessage(content=msg_dict["content"]))
-            elif msg_dict["type"] == "AIMessage":
-                loaded_memory.append(AIMessage(content=msg_dict["content"]))
-            elif msg_dict["type"] == "SystemMessage":
-                loaded_memory.append(SystemMessage(content=msg_dict["content"]))
+            message_type = message_types.get(msg_dict["type"])
+            if message_type:
+                loaded_memory.append(message_type(content=msg_dict["content"]))
         
         if isinstance(loaded_memory[0], HumanMessage):
             results.add_pass("HumanMessage type preserved")
@@ -151,20 +165,13 @@ def test_malformed_memory_handling(results: TestResults):
     """Test handling of corrupted memory file"""
     print(Fore.CYAN + "\n--- Testing Malformed Memory Handling ---")
     
-    # Create temp file with invalid JSON
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        f.write("{ invalid json }")
-        temp_path = f.name
-    
+    # Decoding is all this checks, so no file on disk is needed
+    # (test_memory_serialization covers the real file round trip)
     try:
-        try:
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                json.load(f)
-            results.add_fail("Malformed JSON detected", "No exception raised")
-        except json.JSONDecodeError:
-            results.add_pass("Malformed JSON detected")
-    finally:
-        os.remove(temp_path)
+        _load(io.BytesIO(b"{ invalid json }"))
+        results.add_fail("Malformed JSON detected", "No exception raised")
+    except ValueError:  # orjson and json decode errors both subclass it
+        results.add_pass("Malformed JSON detected")
 
 
 def main():
@@ -174,10 +181,12 @@ def main():
     
     results = TestResults()
     
-    test_memory_serialization(results)
-    test_memory_deque_limits(results)
-    test_empty_memory_handling(results)
-    test_malformed_memory_handling(results)
+    results.run(
+        test_memory_serialization,
+        test_memory_deque_limits,
+        test_empty_memory_handling,
+        test_malformed_memory_handling,
+    )
     
     # Summary
     print(Fore.CYAN + "\n" + "=" * 55)
@@ -190,10 +199,10 @@ def main():
     print(Fore.RED + f"  Failed: {results.failed}")
     
     if results.failed == 0:
-        print(Fore.GREEN + f"\n  {SYM_CHECK} ALL TESTS PASSED!")
+        print(Fore.GREEN + f"\n  {SYMS.check} ALL TESTS PASSED!")
         return 0
     else:
-        print(Fore.RED + f"\n  {SYM_FAIL} {results.failed} test(s) failed")
+        print(Fore.RED + f"\n  {SYMS.fail} {results.failed} test(s) failed")
         return 1
 
 
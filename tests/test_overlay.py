@@ -8,40 +8,44 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QTimer, QSequentialAnimationGroup
 from core.overlay import (OverlayWindow, COLOR_SYSTEM_OK, COLOR_WARNING, 
                           COLOR_CRITICAL, COLOR_ACTIVE_SCAN, COLOR_SUCCESS)
 
+# Demo states: (text, delay before the next state in ms, color)
+_STATES = (
+    ("ALFRED Online", 2000, COLOR_SYSTEM_OK),
+    ("", 1000, COLOR_SYSTEM_OK),
+    ("🎯 Target Acquired", 2000, COLOR_ACTIVE_SCAN),
+    ("🎤 Listening...", 2000, COLOR_ACTIVE_SCAN),
+    ("📝 Analysis in progress...", 2000, COLOR_SYSTEM_OK),
+    ("⚠ Intrusion Detected", 2000, COLOR_WARNING),
+    ("🧠 Decrypting...", 2000, COLOR_SYSTEM_OK),
+    ("✗ System Failure", 2000, COLOR_CRITICAL),
+    ("✓ Mission Accomplished", 2000, COLOR_SUCCESS),
+    ("", 1000, COLOR_SYSTEM_OK),
+    ("💤 Standby Mode", 2000, COLOR_SYSTEM_OK),
+    ("", 0, COLOR_SYSTEM_OK)
+)
+
 def demo_sequence(overlay):
     """Demo the different states with sentiment colors"""
-    states = [
-        ("ALFRED Online", 2000, COLOR_SYSTEM_OK),
-        ("", 1000, COLOR_SYSTEM_OK),
-        ("🎯 Target Acquired", 2000, COLOR_ACTIVE_SCAN),
-        ("🎤 Listening...", 2000, COLOR_ACTIVE_SCAN),
-        ("📝 Analysis in progress...", 2000, COLOR_SYSTEM_OK),
-        ("⚠ Intrusion Detected", 2000, COLOR_WARNING),
-        ("🧠 Decrypting...", 2000, COLOR_SYSTEM_OK),
-        ("✗ System Failure", 2000, COLOR_CRITICAL),
-        ("✓ Mission Accomplished", 2000, COLOR_SUCCESS),
-        ("", 1000, COLOR_SYSTEM_OK),
-        ("💤 Standby Mode", 2000, COLOR_SYSTEM_OK),
-        ("", 0, COLOR_SYSTEM_OK)
-    ]
-    
-    current = [0]
+    # One Qt timeline holds every state's hold time, so the schedule doesn't
+    # drift with callback latency; Python only runs to apply each state
+    timeline = QSequentialAnimationGroup(overlay)
+    for _, delay, _ in _STATES:
+        timeline.addPause(delay)
     
-    def next_state():
-        if current[0] < len(states):
-            text, delay, color = states[current[0]]
-            overlay.set_sentiment_color(color)
-            overlay.set_text(text)
-            print(f"State: {text if text else 'Hidden'} | Color: {color.name() if hasattr(color, 'name') else 'Custom'}")
-            current[0] += 1
-            if delay > 0:
-                QTimer.singleShot(delay, next_state)
+    def apply_state(index):
+        text, _, color = _STATES[index]
+        overlay.show_response(text, color)
+        print(f"State: {text if text else 'Hidden'} | Color: {color.name() if hasattr(color, 'name') else 'Custom'}")
     
-    next_state()
+    # Fires as each later pause begins (the first state is applied up front)
+    timeline.currentAnimationChanged.connect(lambda pause: apply_state(timeline.indexOfAnimation(pause)))
+    timeline.finished.connect(timeline.deleteLater)
+    apply_state(0)
+    timeline.start()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,80 @@
+"""
+Tests for the command checks the worker loop routes on.
+"""
+
+import sys
+from unittest.mock import MagicMock
+
+# Mock the audio, TTS, LLM clients and GUI automation BEFORE importing main
+for _module in ("sounddevice", "faster_whisper", "edge_tts", "keyboard",
+                "langchain_groq", "langchain_ollama", "pyautogui", "pyperclip"):
+    sys.modules[_module] = MagicMock()
+
+from colorama import Fore
+
+from test_utils import TestResults, SYM_CHECK, SYM_FAIL
+
+from main import VISION_RE, EXIT_RE
+
+
+def test_vision_routing(results: TestResults):
+    """Test that vision requests route to the vision path"""
+    print(Fore.CYAN + "\n--- Testing Vision Routing ---")
+
+    for text in ("Take a screenshot", "What am I looking at?", "What are you seeing?",
+                 "Describe this", "Read the screen"):
+        if VISION_RE.search(text):
+            results.add_pass(f"Vision: {text!r}")
+        else:
+            results.add_fail(f"Vision: {text!r}", "not routed to vision")
+
+    if not VISION_RE.search("Open notepad"):
+        results.add_pass("Non-vision command not routed to vision")
+    else:
+        results.add_fail("Non-vision command not routed to vision", "routed to vision")
+
+
+def test_exit_routing(results: TestResults):
+    """Test that exit matches whole words only"""
+    print(Fore.CYAN + "\n--- Testing Exit Routing ---")
+
+    for text, expected in (("Quit", True), ("Exit now, Alfred", True),
+                           ("That was quite good", False), ("Where is the exit?", True)):
+        if bool(EXIT_RE.search(text)) == expected:
+            results.add_pass(f"Exit {expected}: {text!r}")
+        else:
+            results.add_fail(f"Exit {expected}: {text!r}", "wrong match")
+
+
+def main():
+    print(Fore.CYAN + "=" * 55)
+    print(Fore.CYAN + "  ALFRED Routing Test Suite")
+    print(Fore.CYAN + "=" * 55)
+
+    results = TestResults()
+
+    results.run(
+        test_vision_routing,
+        test_exit_routing,
+    )
+
+    # Summary
+    print(Fore.CYAN + "\n" + "=" * 55)
+    print(Fore.CYAN + "  TEST SUMMARY")
+    print(Fore.CYAN + "=" * 55)
+
+    total = results.passed + results.failed
+    print(f"\n  Total Tests: {total}")
+    print(Fore.GREEN + f"  Passed: {results.passed}")
+    print(Fore.RED + f"  Failed: {results.failed}")
+
+    if results.failed == 0:
+        print(Fore.GREEN + f"\n  {SYM_CHECK} ALL TESTS PASSED!")
+        return 0
+    else:
+        print(Fore.RED + f"\n  {SYM_FAIL} {results.failed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,8 +3,10 @@ Test script to verify the Sentiment Engine implementation
 This demonstrates how the Arc Reactor changes color based on context
 """
 
+import re
 import sys
 import os
+from collections import deque
 # Add the parent directory (Project JHANGYA) to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -12,29 +14,38 @@ from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer
 from core.overlay import OverlayWindow, COLOR_HAPPY, COLOR_ALERT, COLOR_ERROR, COLOR_NEUTRAL
 
+# Sentiment tags, stripped from the text before display
+_TAG_RE = re.compile(r"\[(?:HAPPY|ALERT|ERROR|NEUTRAL)\] ")
+
 def test_sentiment_colors():
     """Cycle through different sentiment colors to test the visual feedback"""
     app = QApplication(sys.argv)
     overlay = OverlayWindow()
     overlay.show()
     
-    # Test sequence: Show different sentiments with delays
-    test_cases = [
+    # Test sequence: (ms after the previous step, text, color)
+    events = deque([
         (1000, "System Initializing...", COLOR_NEUTRAL),
-        (3000, "[HAPPY] Successfully connected to all systems!", COLOR_HAPPY),
-        (6000, "[ALERT] Warning: High CPU usage detected", COLOR_ALERT),
-        (9000, "[ERROR] Failed to access system file", COLOR_ERROR),
-        (12000, "[NEUTRAL] Everything is back to normal", COLOR_NEUTRAL),
-        (15000, "Test complete - All colors working!", COLOR_HAPPY),
-    ]
+        (2000, "[HAPPY] Successfully connected to all systems!", COLOR_HAPPY),
+        (3000, "[ALERT] Warning: High CPU usage detected", COLOR_ALERT),
+        (3000, "[ERROR] Failed to access system file", COLOR_ERROR),
+        (3000, "[NEUTRAL] Everything is back to normal", COLOR_NEUTRAL),
+        (3000, "Test complete - All colors working!", COLOR_HAPPY),
+    ])
     
-    for delay, text, color in test_cases:
+    def tick():
+        """Show the next step and schedule the one after it"""
+        _, text, color = events.popleft()
         # Remove sentiment tags for display
-        display_text = text.replace("[HAPPY] ", "").replace("[ALERT] ", "").replace("[ERROR] ", "").replace("[NEUTRAL] ", "")
-        QTimer.singleShot(delay, lambda t=display_text, c=color: update_overlay(overlay, t, c))
+        update_overlay(overlay, _TAG_RE.sub("", text), color)
+        
+        if events:
+            QTimer.singleShot(events[0][0], tick)
+        else:
+            # Close after all tests
+            QTimer.singleShot(3000, app.quit)
     
-    # Close after all tests
-    QTimer.singleShot(18000, app.quit)
+    QTimer.singleShot(events[0][0], tick)
     
     sys.exit(app.exec())
 
@@ -1,5 +1,20 @@
+"""
+Shared helpers for the ALFRED test suites.
+
+Importing this module also puts the project root on sys.path (so core and
+config are importable) and initializes colorama, so suites import it before
+any project module.
+"""
+
+import io
+import os
 import sys
-from colorama import Fore, init
+from dataclasses import dataclass
+from colorama import Fore, Style, init
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 # Initialize colorama
 init(autoreset=True)
@@ -7,45 +22,71 @@ init(autoreset=True)
 # Detect if we need safe ASCII (Windows + non-UTF-8)
 SAFE_MODE = sys.platform == 'win32' and sys.stdout.encoding.lower() not in ('utf-8', 'utf8')
 
-if SAFE_MODE:
-    SYM_CHECK = "[OK]"
-    SYM_FAIL = "[X]"
-    SYM_WARN = "(!)"
-    SYM_PLAY = ">>"
-    SYM_CHART = "#"
-    SYM_SEP = "="
-    SYM_BOX_H = "="
-    SYM_BOX_V = "|"
-    SYM_PARTY = "*"
-else:
-    SYM_CHECK = "✓"
-    SYM_FAIL = "✗"
-    SYM_WARN = "⚠"
-    SYM_PLAY = "▶"
-    SYM_CHART = "📊"
-    SYM_SEP = "═"
-    SYM_BOX_H = "═"
-    SYM_BOX_V = "║"
-    SYM_PARTY = "🎉"
+@dataclass(frozen=True, slots=True)
+class Symbols:
+    """Console symbols for test output"""
+    check: str
+    fail: str
+    warn: str
+    play: str
+    chart: str
+    sep: str
+    box_h: str
+    box_v: str
+    party: str
+
+_ASCII_SYMBOLS = Symbols(check="[OK]", fail="[X]", warn="(!)", play=">>", chart="#",
+                         sep="=", box_h="=", box_v="|", party="*")
+_UNICODE_SYMBOLS = Symbols(check="✓", fail="✗", warn="⚠", play="▶", chart="📊",
+                           sep="═", box_h="═", box_v="║", party="🎉")
+
+SYMS = _ASCII_SYMBOLS if SAFE_MODE else _UNICODE_SYMBOLS
+
+# Flat names, kept for the suites that import them directly
+SYM_CHECK = SYMS.check
+SYM_FAIL = SYMS.fail
+SYM_WARN = SYMS.warn
+SYM_PLAY = SYMS.play
+SYM_CHART = SYMS.chart
+SYM_SEP = SYMS.sep
+SYM_BOX_H = SYMS.box_h
+SYM_BOX_V = SYMS.box_v
+SYM_PARTY = SYMS.party
 
 def get_status_symbol(success: bool) -> str:
-    return SYM_CHECK if success else SYM_FAIL
+    return SYMS.check if success else SYMS.fail
 
 def get_status_color(success: bool) -> str:
     return Fore.GREEN if success else Fore.RED
 
 class TestResults:
-    """Track test results"""
+    """Track test results (result lines are buffered and written once per test)"""
     def __init__(self):
         self.passed = 0
         self.failed = 0
         self.errors = []
+        self._buf = io.StringIO()
     
     def add_pass(self, name):
         self.passed += 1
-        print(Fore.GREEN + f"  {SYM_CHECK} {name}")
+        self._buf.write(f"{Fore.GREEN}  {SYMS.check} {name}{Style.RESET_ALL}\n")
     
     def add_fail(self, name, reason):
         self.failed += 1
         self.errors.append((name, reason))
-        print(Fore.RED + f"  {SYM_FAIL} {name}: {reason}")
+        self._buf.write(f"{Fore.RED}  {SYMS.fail} {name}: {reason}{Style.RESET_ALL}\n")
+    
+    def flush(self):
+        """Write the buffered result lines to stdout in one go"""
+        if self._buf.tell():
+            sys.stdout.write(self._buf.getvalue())
+            self._buf.seek(0)
+            self._buf.truncate()
+    
+    def run(self, *tests):
+        """Run test functions in order, flushing results after each (even if it raises)"""
+        for test in tests:
+            try:
+                test(self)
+            finally:
+                self.flush()
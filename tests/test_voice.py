@@ -0,0 +1,114 @@
+"""
+Tests for the background speech pipeline (synthesis and playback mocked).
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+# Mock the TTS service and global hotkeys BEFORE importing the voice
+sys.modules["edge_tts"] = MagicMock()
+sys.modules["keyboard"] = MagicMock()
+
+from colorama import Fore
+
+from test_utils import TestResults, SYM_CHECK, SYM_FAIL
+
+from core.voice import AlfredVoice
+
+
+def _make_voice(interrupt_on=()):
+    """
+    An AlfredVoice whose synthesis returns the text itself and whose playback
+    records each sentence, reporting an interrupt for those in interrupt_on.
+    """
+    voice = AlfredVoice()
+    voice.played = []
+    voice._synthesize = lambda text: text
+
+    def play(sound):
+        voice.played.append(sound)
+        return sound in interrupt_on
+
+    voice._play = play
+    return voice
+
+
+def test_reply_interrupt(results: TestResults):
+    """Test that an interrupt drops the rest of the reply, including later sentences"""
+    print(Fore.CYAN + "\n--- Testing Reply Interrupt ---")
+
+    voice = _make_voice(interrupt_on={"First sentence."})
+
+    with patch("core.voice.time.sleep"):
+        reply = voice.begin_reply()
+        voice.say("First sentence.", reply)
+        voice.wait_until_done()
+        # Streamed in after the user interrupted
+        voice.say("Second sentence.", reply)
+        voice.wait_until_done()
+
+    if voice.played == ["First sentence."]:
+        results.add_pass("Sentences after interrupt dropped")
+    else:
+        results.add_fail("Sentences after interrupt dropped", str(voice.played))
+
+    with patch("core.voice.time.sleep"):
+        voice.say("Next reply.", voice.begin_reply())
+        voice.wait_until_done()
+
+    if voice.played[-1] == "Next reply.":
+        results.add_pass("Next reply spoken after interrupt")
+    else:
+        results.add_fail("Next reply spoken after interrupt", str(voice.played))
+
+
+def test_reply_uninterrupted(results: TestResults):
+    """Test that sentences of an uninterrupted reply are all spoken in order"""
+    print(Fore.CYAN + "\n--- Testing Uninterrupted Reply ---")
+
+    voice = _make_voice()
+
+    with patch("core.voice.time.sleep"):
+        reply = voice.begin_reply()
+        for sentence in ("One.", "Two.", "Three."):
+            voice.say(sentence, reply)
+        voice.wait_until_done()
+
+    if voice.played == ["One.", "Two.", "Three."]:
+        results.add_pass("All sentences spoken in order")
+    else:
+        results.add_fail("All sentences spoken in order", str(voice.played))
+
+
+def main():
+    print(Fore.CYAN + "=" * 55)
+    print(Fore.CYAN + "  ALFRED Voice Test Suite")
+    print(Fore.CYAN + "=" * 55)
+
+    results = TestResults()
+
+    results.run(
+        test_reply_interrupt,
+        test_reply_uninterrupted,
+    )
+
+    # Summary
+    print(Fore.CYAN + "\n" + "=" * 55)
+    print(Fore.CYAN + "  TEST SUMMARY")
+    print(Fore.CYAN + "=" * 55)
+
+    total = results.passed + results.failed
+    print(f"\n  Total Tests: {total}")
+    print(Fore.GREEN + f"  Passed: {results.passed}")
+    print(Fore.RED + f"  Failed: {results.failed}")
+
+    if results.failed == 0:
+        print(Fore.GREEN + f"\n  {SYM_CHECK} ALL TESTS PASSED!")
+        return 0
+    else:
+        print(Fore.RED + f"\n  {SYM_FAIL} {results.failed} test(s) failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
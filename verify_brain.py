@@ -1,20 +1,76 @@
 import sys
 import os
+import socket
+import argparse
 from dotenv import load_dotenv
 
 load_dotenv()
 
-sys.path.append(os.getcwd())
+# Project root (this script's directory), so it works from any working directory
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
 
-try:
-    print("Importing AlfredBrain...")
-    from core.brain import AlfredBrain
-    print("Initializing AlfredBrain...")
-    brain = AlfredBrain()
-    print("SUCCESS")
-except Exception as e:
-    import traceback
-    traceback.print_exc()
-    print(f"FAILURE: {e}")
+# Localhost port a --serve process answers --check pings on
+DEFAULT_PORT = 47913
+
+def load_brain():
+    """Import and construct AlfredBrain. Returns it, or None on failure."""
+    try:
+        print("Importing AlfredBrain...")
+        from core.brain import AlfredBrain
+        print("Initializing AlfredBrain...")
+        brain = AlfredBrain()
+        print("SUCCESS")
+        return brain
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        print(f"FAILURE: {e}")
+        return None
+
+def serve(port):
+    """Initialize once, then answer each connection with SUCCESS while the brain stays loaded."""
+    brain = load_brain()
+    if brain is None:
+        return 1
+
+    with socket.create_server(("127.0.0.1", port)) as server:
+        print(f"Serving warm AlfredBrain on 127.0.0.1:{port} (Ctrl+C to stop)")
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    conn.sendall(b"SUCCESS\n")
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+def check(port):
+    """Ping a running --serve process instead of paying the cold start again."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+            reply = conn.recv(64).decode().strip()
+    except OSError as e:
+        print(f"FAILURE: no verify_brain server on port {port} ({e})")
+        return 1
+
+    print(reply)
+    return 0 if reply == "SUCCESS" else 1
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that AlfredBrain initializes.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--serve", action="store_true",
+                      help="initialize once and keep answering --check pings")
+    mode.add_argument("--check", action="store_true",
+                      help="ask a running --serve process instead of initializing")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    if args.serve:
+        sys.exit(serve(args.port))
+    elif args.check:
+        sys.exit(check(args.port))
+    else:
+        load_brain()